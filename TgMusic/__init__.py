@@ -113,9 +113,12 @@ class Bot(Client):
             self.logger.info(f"Active chats: {stats['bot']['active_chats']}")
             self.logger.info("=" * 60)
             
+            from TgMusic.core.thumbnails import close_http_client
+
             shutdown_tasks = [
                 self.db.close(),
                 self.call_manager.stop(),
+                close_http_client(),
             ]
 
             if graceful:
@@ -5,8 +5,9 @@
 
 import asyncio
 import time
+from array import array
 from collections import deque
-from typing import Any, Optional, TypeAlias, Union, Dict, List
+from typing import Any, Optional, TypeAlias, Union, Dict, List, Tuple
 from dataclasses import dataclass, field
 
 from cachetools import TTLCache, LRUCache
@@ -276,7 +277,12 @@ class OptimizedChatCacher:
         self.metrics = CacheMetrics()
         self._lock = asyncio.Lock()
         self._operation_count = 0
+        # Last rendered /queue text per chat; dropped whenever that chat's queue changes
+        self.queue_render_cache = TTLCache(maxsize=1000, ttl=2)
         
+    def _queue_changed(self, chat_id: int) -> None:
+        self.queue_render_cache.pop(chat_id, None)
+
     async def _safe_operation(self, operation: str, func, *args, **kwargs):
         """Execute cache operation safely with metrics tracking."""
         start_time = time.time()
@@ -305,13 +311,25 @@ class OptimizedChatCacher:
             self.metrics.record_error()
             return None
 
+    @staticmethod
+    def _new_chat_data(active: bool) -> Dict[str, Any]:
+        """Create an empty chat entry; durations mirror the queue as a packed array."""
+        return {"is_active": active, "queue": deque(), "durations": array("i")}
+
     def add_song(self, chat_id: int, song: CachedTrack) -> Optional[CachedTrack]:
         """Add song to chat queue with error handling."""
         try:
-            data = self.chat_cache.setdefault(
-                chat_id, {"is_active": True, "queue": deque()}
-            )
-            data["queue"].append(song)
+            data = self.chat_cache.get(chat_id)
+            if data is None:
+                data = self.chat_cache[chat_id] = self._new_chat_data(True)
+            # Durations first: if the packed array rejects the value, the queue stays untouched
+            data["durations"].append(int(song.duration or 0))
+            try:
+                data["queue"].append(song)
+            except Exception:
+                data["durations"].pop()
+                raise
+            self._queue_changed(chat_id)
             self.metrics.record_set()
             return song
         except Exception as e:
@@ -345,6 +363,8 @@ class OptimizedChatCacher:
             queue = self.chat_cache.get(chat_id, {}).get("queue")
             if queue:
                 song = queue.popleft()
+                del self.chat_cache[chat_id]["durations"][0]
+                self._queue_changed(chat_id)
                 self.metrics.record_delete()
                 return song
             return None
@@ -365,9 +385,9 @@ class OptimizedChatCacher:
     def set_active(self, chat_id: int, active: bool) -> bool:
         """Set chat active status."""
         try:
-            data = self.chat_cache.setdefault(
-                chat_id, {"is_active": active, "queue": deque()}
-            )
+            data = self.chat_cache.get(chat_id)
+            if data is None:
+                data = self.chat_cache[chat_id] = self._new_chat_data(active)
             data["is_active"] = active
             # Update last activity timestamp
             data["last_activity"] = time.time()
@@ -381,9 +401,9 @@ class OptimizedChatCacher:
     def update_activity(self, chat_id: int) -> bool:
         """Update chat's last activity timestamp."""
         try:
-            data = self.chat_cache.setdefault(
-                chat_id, {"is_active": False, "queue": deque()}
-            )
+            data = self.chat_cache.get(chat_id)
+            if data is None:
+                data = self.chat_cache[chat_id] = self._new_chat_data(False)
             data["last_activity"] = time.time()
             self.metrics.record_set()
             return True
@@ -395,6 +415,7 @@ class OptimizedChatCacher:
     def clear_chat(self, chat_id: int) -> bool:
         """Clear all chat data."""
         try:
+            self._queue_changed(chat_id)
             if chat_id in self.chat_cache:
                 del self.chat_cache[chat_id]
                 self.metrics.record_delete()
@@ -430,6 +451,7 @@ class OptimizedChatCacher:
             queue = self.chat_cache.get(chat_id, {}).get("queue", deque())
             if queue:
                 queue[0].loop = loop
+                self._queue_changed(chat_id)
                 self.metrics.record_set()
                 return True
             return False
@@ -446,6 +468,8 @@ class OptimizedChatCacher:
                 queue_list = list(queue)
                 queue_list.pop(queue_index)
                 self.chat_cache[chat_id]["queue"] = deque(queue_list)
+                del self.chat_cache[chat_id]["durations"][queue_index]
+                self._queue_changed(chat_id)
                 self.metrics.record_delete()
                 return True
             return False
@@ -463,6 +487,15 @@ class OptimizedChatCacher:
             self.metrics.record_error()
             return []
 
+    def get_durations(self, chat_id: int) -> array:
+        """Get queued track durations for chat, aligned with get_queue()."""
+        try:
+            return array("i", self.chat_cache.get(chat_id, {}).get("durations", ()))
+        except Exception as e:
+            LOGGER.error("Error getting durations for chat %s: %s", chat_id, e)
+            self.metrics.record_error()
+            return array("i")
+
     def get_active_chats(self) -> List[int]:
         """Get list of all active chats."""
         try:
@@ -475,13 +508,34 @@ class OptimizedChatCacher:
             self.metrics.record_error()
             return []
 
+    def iter_active_chats(self) -> Tuple[int, ...]:
+        """Get an immutable snapshot of active chats, safe to hold across awaits."""
+        try:
+            return tuple(
+                chat_id for chat_id, data in self.chat_cache.items()
+                if data.get("is_active", False)
+            )
+        except Exception as e:
+            LOGGER.error("Error getting active chats: %s", e)
+            self.metrics.record_error()
+            return ()
+
+    def count_active_chats(self) -> int:
+        """Count active chats without building a list."""
+        try:
+            return sum(1 for data in self.chat_cache.values() if data.get("is_active", False))
+        except Exception as e:
+            LOGGER.error("Error counting active chats: %s", e)
+            self.metrics.record_error()
+            return 0
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get comprehensive cache statistics."""
         try:
             return {
                 **self.metrics.get_stats(),
                 "total_chats": len(self.chat_cache),
-                "active_chats": len(self.get_active_chats()),
+                "active_chats": self.count_active_chats(),
                 "total_operations": self._operation_count,
                 "average_queue_length": self._get_average_queue_length(),
             }
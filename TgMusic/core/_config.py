@@ -64,6 +64,9 @@ class BotConfig:
             "IGNORE_BACKGROUND_UPDATES", True
         )
         self.AUTO_LEAVE: bool = self._get_env_bool("AUTO_LEAVE", True)
+        self.JOB_METRICS_SAMPLING: bool = self._get_env_bool(
+            "JOB_METRICS_SAMPLING", False
+        )
 
         # Cookies
         self.COOKIES_URL: list[str] = self._process_cookie_urls(
@@ -7,6 +7,7 @@ import asyncio
 import time
 from typing import Optional, List, Dict, Any, Union
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
 from cachetools import TTLCache, LRUCache
 from pymongo import AsyncMongoClient, ReturnDocument
@@ -70,6 +71,14 @@ class DatabaseMetrics:
         }
 
 
+@dataclass(slots=True, frozen=True)
+class ChatSettings:
+    """Per-chat playback settings resolved from a single chat document."""
+    thumbnail: bool = True
+    buttons: bool = True
+    play_type: int = 0
+
+
 class Database:
     """High-performance database layer with advanced caching and error handling."""
     
@@ -451,6 +460,17 @@ class Database:
         chat = await self.get_chat(chat_id)
         return chat.get("thumb", True) if chat else True
 
+    async def get_chat_settings(self, chat_id: int) -> ChatSettings:
+        """Get thumbnail, buttons and play type settings with one cached lookup."""
+        chat = await self.get_chat(chat_id)
+        if not chat:
+            return ChatSettings()
+        return ChatSettings(
+            thumbnail=chat.get("thumb", True),
+            buttons=chat.get("buttons", True),
+            play_type=chat.get("play_type", 0),
+        )
+
     async def remove_chat(self, chat_id: int) -> None:
         """Remove chat with cache cleanup."""
         try:
@@ -3,13 +3,16 @@
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 #  Modified by Devin - Major modifications and improvements
 
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Union
 
 from pydantic import BaseModel
 
 
-class CachedTrack(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CachedTrack:
     url: str
     name: str
     artist: str
@@ -22,6 +25,16 @@ class CachedTrack(BaseModel):
     is_video: bool
     platform: str
 
+    def __post_init__(self) -> None:
+        # Callers pass durations and loop counts straight from API payloads
+        self.duration = int(self.duration or 0)
+        self.loop = int(self.loop or 0)
+
+    @property
+    def display_name(self) -> str:
+        """Track name truncated for queue listings."""
+        return self.name[:45]
+
 
 class TrackInfo(BaseModel):
     url: str
@@ -48,6 +61,16 @@ class MusicTrack(BaseModel):
     duration: int
     platform: str
 
+    @cached_property
+    def button_name(self) -> str:
+        """Track name truncated for inline keyboard buttons."""
+        return self.name[:18]
+
+    @cached_property
+    def cb_play(self) -> bytes:
+        """Callback payload for selecting this track to play."""
+        return f"play_{self.platform.lower()}_{self.id}".encode()
+
 
 class PlatformTracks(BaseModel):
     tracks: list[MusicTrack]
@@ -3,10 +3,19 @@
 #  Part of the Hybrid VC Bot project. All rights reserved where applicable.
 #  Modified by Devin - Major modifications and improvements
 
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from TgMusic.core._database import db
 
 
+def _resolve_tables(translations: dict, default: str) -> dict[str, dict[str, str]]:
+    """Merge each language over the default so missing keys fall back in one lookup."""
+    base = translations[default]
+    return {lang: {**base, **table} for lang, table in translations.items()}
+
+
 class LanguageManager:
     """Multi-language support system for Hybrid VC Bot."""
     
@@ -16,6 +25,8 @@ class LanguageManager:
         "id-ID": "Bahasa Indonesia"
     }
     
+    _SUPPORTED_VIEW = MappingProxyType(SUPPORTED_LANGUAGES)
+    
     # Default language
     DEFAULT_LANGUAGE = "en-US"
     
@@ -516,6 +527,9 @@ class LanguageManager:
         }
     }
     
+    # Flattened per-language tables, resolved once at import
+    _TABLES = _resolve_tables(TRANSLATIONS, DEFAULT_LANGUAGE)
+    
     def __init__(self):
         self.current_language = self.DEFAULT_LANGUAGE
     
@@ -556,10 +570,29 @@ class LanguageManager:
         if language is None:
             language = self.current_language
         
-        if language not in self.TRANSLATIONS:
-            language = self.DEFAULT_LANGUAGE
+        if not kwargs:
+            table = self._TABLES.get(language) or self._TABLES[self.DEFAULT_LANGUAGE]
+            text = table.get(key)
+            return text if text is not None else f"[{key}]"
         
-        text = self.TRANSLATIONS[language].get(key, f"[{key}]")
+        try:
+            # Key on each value's type too: 1, True and 1.0 hash equal but format differently
+            typed_items = tuple(sorted((k, type(v), v) for k, v in kwargs.items()))
+            return self._cached_text(key, language, typed_items)
+        except TypeError:  # Unhashable format argument, render uncached
+            return self._render_text(key, language, kwargs)
+    
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _cached_text(cls, key: str, language: str, kwargs_items: tuple) -> str:
+        """Memoized get_text keyed by (key, language, sorted typed kwargs)."""
+        return cls._render_text(key, language, {k: v for k, _, v in kwargs_items})
+    
+    @classmethod
+    def _render_text(cls, key: str, language: str, kwargs: dict[str, Any]) -> str:
+        """Look up and format a translation string."""
+        table = cls._TABLES.get(language) or cls._TABLES[cls.DEFAULT_LANGUAGE]
+        text = table.get(key, f"[{key}]")
         
         # Format with kwargs if provided
         if kwargs:
@@ -570,9 +603,9 @@ class LanguageManager:
         
         return text
     
-    def get_supported_languages(self) -> Dict[str, str]:
-        """Get list of supported languages."""
-        return self.SUPPORTED_LANGUAGES.copy()
+    def get_supported_languages(self) -> Mapping[str, str]:
+        """Get a read-only view of supported languages."""
+        return self._SUPPORTED_VIEW
     
     def is_supported_language(self, language: str) -> bool:
         """Check if language is supported."""
@@ -4,12 +4,22 @@
 #  Modified by Devin - Major modifications and improvements
 
 import asyncio
+import bisect
+import functools
+import itertools
+import hashlib
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from contextlib import suppress
 from io import BytesIO
 from pathlib import Path
+from typing import Callable, NamedTuple
 
 import httpx
+from cachetools import LRUCache
 from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont, ImageOps
-from aiofiles.os import path as aiopath
 
 from ._dataclass import CachedTrack
 from TgMusic.logger import LOGGER
@@ -21,32 +31,287 @@ FONTS = {
     "tfont": ImageFont.truetype("TgMusic/modules/utils/font.ttf", 20),
 }
 
+@functools.lru_cache(maxsize=64)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Parse each (font file, size) pair once per process."""
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return ImageFont.load_default()
 
-def resize_youtube_thumbnail(img: Image.Image) -> Image.Image:
+
+@functools.lru_cache(maxsize=16)
+def _rounded_mask(size: tuple[int, int], radius: int) -> Image.Image:
     """
-    Resize a YouTube thumbnail to 640x640 while keeping important content.
+    Rasterize a rounded-rectangle 'L' mask once per (size, radius).
 
-    It crops the center of the image after resizing.
+    The returned image is shared between callers and must not be modified.
+    """
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, *size), radius=radius, fill=255)
+    return mask
+
+
+TEMPLATE_PATHS = (
+    "TgMusic/modules/utils/thumb.png",
+    "thumb.png",
+    "/mnt/data/Uh6Il.png",
+)
+
+
+def _load_template() -> Image.Image | None:
+    """Decode the first available template once; gen_thumb draws on copies."""
+    for p in TEMPLATE_PATHS:
+        try:
+            img = Image.open(p).convert("RGBA")
+            # A fully opaque template needs no alpha channel in the saved thumbnail
+            if img.getextrema()[3][0] == 255:
+                img = img.convert("RGB")
+            return img
+        except Exception:
+            continue
+    return None
+
+
+_TEMPLATE_IMG = _load_template()
+
+
+# === CONFIGURABLE SETTINGS ===
+TITLE_FONT_SIZE = 50     # base title font size
+ARTIST_FONT_SIZE = 22    # base artist font size
+TITLE_UP_OFFSET = -75    # negative = move up, positive = move down
+ARTIST_UP_OFFSET = -5    # negative = move up, positive = move down
+# ==============================
+
+FONT_PATH = "TgMusic/modules/utils/font.ttf"
+
+
+class _Layout(NamedTuple):
+    album_size: int
+    cover_x: int
+    cover_y: int
+    cover_radius: int
+    title_font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+    artist_font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+    dur_font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+    title_x: int
+    title_y: int
+    max_title_width: int
+    artist_gap: int
+    dur_x: int
+    prog_min_y: int
+    prog_max_y: int
+
+
+@functools.lru_cache(maxsize=4)
+def _layout(W: int, H: int) -> _Layout:
+    """
+    Resolve every size-dependent value for a template of W x H.
+
+    The reference coordinates are for 1280x720; templates are fixed-size, so this
+    runs once per process and the renderer only reads the folded results.
+    """
+    left_min_x = int(82 / 1280 * W)
+    left_min_y = int(76 / 720 * H)
+    left_max_x = int(649 / 1280 * W)
+    left_max_y = int(643 / 720 * H)
+    left_w = left_max_x - left_min_x
+    left_h = left_max_y - left_min_y
+
+    wave_min_x = int(692 / 1280 * W)
+    wave_min_y = int(229 / 720 * H)
+    wave_max_x = int(1192 / 1280 * W)
+
+    album_padding = max(16, int(28 / 1280 * W))
+    album_size = min(left_w, left_h) - album_padding * 2
+    album_size = max(32, album_size)
+
+    title_x = wave_min_x + int(18 / 1280 * W)
+    title_top_margin = int(70 / 720 * H)
+    max_title_width = wave_max_x - title_x - int(18 / 1280 * W)
+    if max_title_width <= 0:
+        max_title_width = int(420 / 1280 * W)
+
+    return _Layout(
+        album_size=album_size,
+        cover_x=left_min_x + (left_w - album_size) // 2,
+        cover_y=left_min_y + (left_h - album_size) // 2,
+        cover_radius=max(12, int(28 / 1280 * W)),
+        title_font=_get_font(FONT_PATH, int(TITLE_FONT_SIZE / 1280 * W)),
+        artist_font=_get_font(FONT_PATH, int(ARTIST_FONT_SIZE / 1280 * W)),
+        dur_font=_get_font(FONT_PATH, int(25 / 1280 * W)),
+        title_x=title_x,
+        title_y=max(int(16 / 720 * H), wave_min_y - title_top_margin) + TITLE_UP_OFFSET,
+        max_title_width=max_title_width,
+        artist_gap=int(6 / 720 * H) + ARTIST_UP_OFFSET,
+        dur_x=int(1201 / 1280 * W) + int(6 / 1280 * W),
+        prog_min_y=int(414 / 720 * H),
+        prog_max_y=int(453 / 720 * H),
+    )
+
+
+# Decoded covers by URL; albums and playlists often share artwork across tracks.
+# Bounded by decoded pixel bytes, since one large cover can outweigh dozens of small ones.
+_IMAGE_CACHE_BYTES = 40 * 1024 * 1024
+
+
+def _image_nbytes(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+_image_cache: LRUCache = LRUCache(maxsize=_IMAGE_CACHE_BYTES, getsizeof=_image_nbytes)
+
+# Shared client so thumbnail fetches reuse pooled keep-alive connections
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=5,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared thumbnail HTTP client, if it was ever opened."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class ThumbCache:
     """
-    target_size = 640
-    aspect_ratio = img.width / img.height
+    Size-bounded LRU of rendered thumbnails on disk.
 
-    if aspect_ratio > 1:
-        new_width = int(target_size * aspect_ratio)
-        new_height = target_size
-    else:
-        new_width = target_size
-        new_height = int(target_size / aspect_ratio)
+    Entries are keyed by a hash of everything that affects the rendered image,
+    and the least recently used files are deleted once the directory exceeds
+    its byte budget. The index is rebuilt from the directory on first use.
+    Files handed out recently are never evicted, since the caller may still be
+    uploading them.
+    """
 
-    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # Seconds a returned file stays protected from eviction
+    PIN_SECONDS = 60
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._served: dict[str, float] = {}
+        self._total = 0
+        self._loaded = False
+
+    @staticmethod
+    def key(song: CachedTrack) -> str:
+        raw = f"{song.track_id}|{song.name}|{song.artist}|{song.duration}|{song.thumbnail}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def path(self, key: str) -> str:
+        return str(self.directory / f"{key}.png")
+
+    def _scan(self) -> list[tuple[float, str, int]]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        found = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # Left behind by a render interrupted mid-write
+                    with suppress(OSError):
+                        os.remove(entry.path)
+                elif entry.name.endswith(".png"):
+                    st = entry.stat()
+                    found.append((st.st_mtime, entry.name[:-4], st.st_size))
+        found.sort()
+        return found
+
+    async def _load(self) -> None:
+        found = await asyncio.to_thread(self._scan)
+        if self._loaded:
+            return
+        for _, key, size in found:
+            self._entries[key] = size
+            self._total += size
+        self._loaded = True
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached file for key and mark it recently used."""
+        if not self._loaded:
+            await self._load()
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        self._served[key] = time.monotonic()
+        return self.path(key)
+
+    async def put(self, key: str, save: Callable[[str], None]) -> str:
+        """
+        Write a rendered file into the cache and enforce the budget.
+
+        save is called with a unique temporary path in a single worker-thread
+        hop, together with the atomic rename into place and the size lookup,
+        so concurrent renders of the same key never share a half-written file.
+        """
+        dest = self.path(key)
+
+        def _commit() -> int:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(fd)
+            try:
+                save(tmp_path)
+                os.replace(tmp_path, dest)
+            except BaseException:
+                with suppress(OSError):
+                    os.remove(tmp_path)
+                raise
+            return os.path.getsize(dest)
+
+        size = await asyncio.to_thread(_commit)
+        self._total += size - self._entries.pop(key, 0)
+        self._entries[key] = size
+        now = self._served[key] = time.monotonic()
+
+        evicted = []
+        for old_key in list(self._entries):
+            if self._total <= self.max_bytes:
+                break
+            if now - self._served.get(old_key, float("-inf")) < self.PIN_SECONDS:
+                continue  # Just inserted or recently handed to a caller
+            self._total -= self._entries.pop(old_key)
+            self._served.pop(old_key, None)
+            evicted.append(self.path(old_key))
+
+        if evicted:
+            def _remove() -> None:
+                for path in evicted:
+                    with suppress(FileNotFoundError):
+                        os.remove(path)
+
+            await asyncio.to_thread(_remove)
+        return dest
+
+
+THUMB_CACHE_MAX_BYTES = 256 * 1024 * 1024
+thumb_cache = ThumbCache("database/photos", THUMB_CACHE_MAX_BYTES)
 
-    # Crop to 640x640 (center crop)
-    left = (img.width - target_size) // 2
-    top = (img.height - target_size) // 2
-    right = left + target_size
-    bottom = top + target_size
 
-    return img.crop((left, top, right, bottom))
+def resize_youtube_thumbnail(img: Image.Image) -> Image.Image:
+    """
+    Resize a YouTube thumbnail to 640x640 while keeping important content.
+
+    It crops the center of the image after resizing.
+    """
+    target_size = (640, 640)
+    if img.size == target_size:
+        return img
+
+    # Crop the centered square first so Lanczos only resamples the pixels we keep
+    return ImageOps.fit(img, target_size, Image.Resampling.LANCZOS, centering=(0.5, 0.5))
 
 
 def resize_jiosaavn_thumbnail(img: Image.Image) -> Image.Image:
@@ -56,10 +321,27 @@ def resize_jiosaavn_thumbnail(img: Image.Image) -> Image.Image:
     It upscales the image while preserving quality.
     """
     target_size = 600
+    if img.size == (target_size, target_size):
+        return img
     img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
     return img
 
 
+def _decode_image(buf: BytesIO, url: str) -> Image.Image:
+    img = Image.open(buf)
+    # Let libjpeg decode oversized covers at a reduced DCT scale; nothing here needs more than 640px
+    if img.format == "JPEG":
+        img.draft("RGB", (640, 640))
+    img = img.convert("RGBA")
+    if url.startswith("https://i.ytimg.com"):
+        img = resize_youtube_thumbnail(img)
+    elif url.startswith("http://c.saavncdn.com") or url.startswith(
+        "https://i1.sndcdn"
+    ):
+        img = resize_jiosaavn_thumbnail(img)
+    return img
+
+
 async def fetch_image(url: str) -> Image.Image | None:
     """
     Fetches an image from the given URL, resizes it if necessary for JioSaavn and
@@ -75,23 +357,26 @@ async def fetch_image(url: str) -> Image.Image | None:
     if not url:
         return None
 
-    async with httpx.AsyncClient() as client:
-        try:
-            if url.startswith("https://is1-ssl.mzstatic.com"):
-                url = url.replace("500x500bb.jpg", "600x600bb.jpg")
-            response = await client.get(url, timeout=5)
+    try:
+        if url.startswith("https://is1-ssl.mzstatic.com"):
+            url = url.replace("500x500bb.jpg", "600x600bb.jpg")
+        if (cached := _image_cache.get(url)) is not None:
+            return cached.copy()
+
+        # Stream the body straight into the buffer PIL reads from instead of keeping response.content too
+        buf = BytesIO()
+        async with _get_http_client().stream("GET", url) as response:
             response.raise_for_status()
-            img = Image.open(BytesIO(response.content)).convert("RGBA")
-            if url.startswith("https://i.ytimg.com"):
-                img = resize_youtube_thumbnail(img)
-            elif url.startswith("http://c.saavncdn.com") or url.startswith(
-                "https://i1.sndcdn"
-            ):
-                img = resize_jiosaavn_thumbnail(img)
-            return img
-        except Exception as e:
-            LOGGER.error("Image loading error: %s", e)
-            return None
+            async for chunk in response.aiter_bytes(65536):
+                buf.write(chunk)
+        buf.seek(0)
+        img = await asyncio.to_thread(_decode_image, buf, url)
+        if _image_nbytes(img) <= _IMAGE_CACHE_BYTES:
+            _image_cache[url] = img
+        return img.copy()
+    except Exception as e:
+        LOGGER.error("Image loading error: %s", e)
+        return None
 
 
 def clean_text(text: str, limit: int = 17) -> str:
@@ -102,6 +387,12 @@ def clean_text(text: str, limit: int = 17) -> str:
     return f"{text[:limit - 3]}..." if len(text) > limit else text
 
 
+@functools.lru_cache(maxsize=1)
+def _controls_overlay() -> Image.Image:
+    """Decode the player-controls overlay once; callers only paste from it."""
+    return Image.open("TgMusic/modules/utils/controls.png").convert("RGBA")
+
+
 def add_controls(img: Image.Image) -> Image.Image:
     """
     Adds blurred background effect and overlay controls.
@@ -110,15 +401,10 @@ def add_controls(img: Image.Image) -> Image.Image:
     box = (120, 120, 520, 480)
 
     region = img.crop(box)
-    controls = Image.open("TgMusic/modules/utils/controls.png").convert("RGBA")
+    controls = _controls_overlay()
     dark_region = ImageEnhance.Brightness(region).enhance(0.5)
 
-    mask = Image.new("L", dark_region.size, 0)
-    ImageDraw.Draw(mask).rounded_rectangle(
-        (0, 0, box[2] - box[0], box[3] - box[1]), 40, fill=255
-    )
-
-    img.paste(dark_region, box, mask)
+    img.paste(dark_region, box, _rounded_mask(dark_region.size, 40))
     img.paste(controls, (135, 305), controls)
 
     return img
@@ -126,7 +412,9 @@ def add_controls(img: Image.Image) -> Image.Image:
 
 def make_sq(image: Image.Image, size: int = 125) -> Image.Image:
     """
-    Crops an image into a rounded square.
+    Center-crops an image into a size x size square.
+
+    Rounding is left to the caller, which pastes through _rounded_mask.
     """
     width, height = image.size
     side_length = min(width, height)
@@ -138,14 +426,8 @@ def make_sq(image: Image.Image, size: int = 125) -> Image.Image:
             (height + side_length) // 2,
         )
     )
-    resize = crop.resize((size, size), Image.Resampling.LANCZOS)
-
-    mask = Image.new("L", (size, size), 0)
-    ImageDraw.Draw(mask).rounded_rectangle((0, 0, size, size), radius=30, fill=255)
-
-    rounded = ImageOps.fit(resize, (size, size))
-    rounded.putalpha(mask)
-    return rounded
+    # reducing_gap box-reduces large crops to ~2x the target before the Lanczos pass
+    return crop.resize((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
 
 
 def get_duration(duration: int, time: str = "0:24") -> str:
@@ -163,132 +445,62 @@ def get_duration(duration: int, time: str = "0:24") -> str:
         return "0:00"
 
 
-async def gen_thumb(song: CachedTrack) -> str:
-    # === CONFIGURABLE SETTINGS ===
-    TITLE_FONT_SIZE = 50     # base title font size
-    ARTIST_FONT_SIZE = 22    # base artist font size
-    TITLE_UP_OFFSET = -75    # negative = move up, positive = move down
-    ARTIST_UP_OFFSET = -5    # negative = move up, positive = move down
-    # ==============================
-
-    save_dir = f"database/photos/{song.track_id}.png"
-    if await aiopath.exists(save_dir):
-        return save_dir
-
-    title_raw = (song.name or "").strip() or "Unknown Title"
-    artist_raw = (song.artist or "Unknown Artist").strip()
-    duration = int(song.duration or 0)
-
-    # Load template
-    template_paths = [
-        "TgMusic/modules/utils/thumb.png",
-        "thumb.png",
-        "/mnt/data/Uh6Il.png",
-    ]
-    base_img = None
-    for p in template_paths:
-        try:
-            base_img = Image.open(p).convert("RGBA")
-            break
-        except Exception:
-            continue
-    if base_img is None:
-        LOGGER.error("Template image loading error.")
-        return ""
-
-    W, H = base_img.size
-
-    left_min_x = int(82 / 1280 * W)
-    left_min_y = int(76 / 720 * H)
-    left_max_x = int(649 / 1280 * W)
-    left_max_y = int(643 / 720 * H)
-    left_w = left_max_x - left_min_x
-    left_h = left_max_y - left_min_y
-
-    wave_min_x = int(692 / 1280 * W)
-    wave_min_y = int(229 / 720 * H)
-    wave_max_x = int(1192 / 1280 * W)
-    wave_max_y = int(626 / 720 * H)
-
-    prog_min_x = int(696 / 1280 * W)
-    prog_min_y = int(414 / 720 * H)
-    prog_max_x = int(1201 / 1280 * W)
-    prog_max_y = int(453 / 720 * H)
-
-    album_padding = max(16, int(28 / 1280 * W))
-    album_size = min(left_w, left_h) - album_padding * 2
-    album_size = max(32, album_size)
-    cover_x = left_min_x + (left_w - album_size) // 2
-    cover_y = left_min_y + (left_h - album_size) // 2
-
-    thumb_img = await fetch_image(song.thumbnail)
-    if not thumb_img:
-        LOGGER.error("No thumbnail for song %s", song.track_id)
-        return ""
+def _render_thumb(
+    thumb_img: Image.Image, title_raw: str, artist_raw: str, duration: int
+) -> Image.Image:
+    """
+    Draw the now-playing card on a copy of the template.
 
-    try:
-        album_cover = make_sq(thumb_img, album_size)
-    except Exception:
-        w0, h0 = thumb_img.size
-        s = min(w0, h0)
-        crop = thumb_img.crop(((w0 - s) // 2, (h0 - s) // 2, (w0 + s) // 2, (h0 + s) // 2))
-        album_cover = crop.resize((album_size, album_size), Image.Resampling.LANCZOS).convert("RGBA")
+    Pure CPU work with no event-loop access; gen_thumb runs it in a worker thread.
+    """
+    base_img = _TEMPLATE_IMG.copy()
+    L = _layout(*base_img.size)
+    album_size = L.album_size
 
-    try:
-        radius = max(12, int(28 / 1280 * W))
-        mask = Image.new("L", (album_size, album_size), 0)
-        ImageDraw.Draw(mask).rounded_rectangle((0, 0, album_size, album_size), radius=radius, fill=255)
-        album_cover.putalpha(mask)
-    except Exception:
-        pass
+    album_cover = make_sq(thumb_img, album_size)
 
-    base_img.paste(album_cover, (cover_x, cover_y), album_cover)
+    # The rounded mask goes straight into the paste; the cover itself is never putalpha'd
+    base_img.paste(
+        album_cover, (L.cover_x, L.cover_y), _rounded_mask((album_size, album_size), L.cover_radius)
+    )
 
     draw = ImageDraw.Draw(base_img)
 
-    def _get_font(path, size):
-        try:
-            return ImageFont.truetype(path, size)
-        except Exception:
-            return ImageFont.load_default()
-
-    title_font = _get_font("TgMusic/modules/utils/font.ttf", int(TITLE_FONT_SIZE / 1280 * W))
-    artist_font = _get_font("TgMusic/modules/utils/font.ttf", int(ARTIST_FONT_SIZE / 1280 * W))
-    dur_font = _get_font("TgMusic/modules/utils/font.ttf", int(25 / 1280 * W))
+    title_font = L.title_font
+    artist_font = L.artist_font
+    dur_font = L.dur_font
 
     title_color = (0, 0, 0)
     artist_color = (50, 50, 50)
     dur_color = (20, 20, 20)
 
-    title_x = wave_min_x + int(18 / 1280 * W)
-    title_top_margin = int(70 / 720 * H)
-    title_y = max(int(16 / 720 * H), wave_min_y - title_top_margin) + TITLE_UP_OFFSET
-
-    max_title_width = wave_max_x - title_x - int(18 / 1280 * W)
-    if max_title_width <= 0:
-        max_title_width = int(420 / 1280 * W)
+    title_x = L.title_x
+    max_title_width = L.max_title_width
 
     def wrap_text(text, font, max_w, max_lines=2):
         words = text.split()
         if not words:
             return []
+        # Measure each word once and pack greedily on the summed widths
+        widths = [font.getlength(w) for w in words]
+        space = font.getlength(" ")
         lines = []
-        cur = words[0]
-        for w in words[1:]:
-            test = cur + " " + w
-            bbox = draw.textbbox((0, 0), test, font=font)
-            if bbox[2] - bbox[0] <= max_w:
-                cur = test
+        cur, cur_w = [words[0]], widths[0]
+        for w, w_w in zip(words[1:], widths[1:]):
+            test_w = cur_w + space + w_w
+            if test_w <= max_w:
+                cur.append(w)
+                cur_w = test_w
             else:
-                lines.append(cur)
-                cur = w
-        lines.append(cur)
-        if len(lines) > max_lines:
-            lines = lines[:max_lines]
-        return lines
+                lines.append(" ".join(cur))
+                if len(lines) == max_lines:
+                    return lines
+                cur, cur_w = [w], w_w
+        lines.append(" ".join(cur))
+        return lines[:max_lines]
 
     title_lines = wrap_text(title_raw, title_font, max_title_width, max_lines=2)
-    y_cursor = title_y
+    y_cursor = L.title_y
     line_spacing = int(title_font.size * 1.05)
     for line in title_lines:
         draw.text((title_x, y_cursor), line, font=title_font, fill=title_color)
@@ -296,12 +508,16 @@ async def gen_thumb(song: CachedTrack) -> str:
 
     artist_max_w = max_title_width
     artist_line = artist_raw
-    if draw.textlength(artist_line, font=artist_font) > artist_max_w:
-        while draw.textlength(artist_line + "...", font=artist_font) > artist_max_w and len(artist_line) > 0:
-            artist_line = artist_line[:-1]
-        artist_line = artist_line.rstrip() + "..."
-
-    artist_y = y_cursor + int(6 / 720 * H) + ARTIST_UP_OFFSET
+    if artist_font.getlength(artist_line) > artist_max_w:
+        # Find the cut from per-character widths, then correct for kerning with real measurements
+        limit = artist_max_w - artist_font.getlength("...")
+        cum = list(itertools.accumulate(artist_font.getlength(c) for c in artist_line))
+        cut = bisect.bisect_right(cum, limit)
+        while cut > 0 and artist_font.getlength(artist_line[:cut] + "...") > artist_max_w:
+            cut -= 1
+        artist_line = artist_line[:cut].rstrip() + "..."
+
+    artist_y = y_cursor + L.artist_gap
     draw.text((title_x, artist_y), artist_line, font=artist_font, fill=artist_color)
 
     def format_duration(sec):
@@ -309,11 +525,46 @@ async def gen_thumb(song: CachedTrack) -> str:
         return f"{m}:{s:02d}"
 
     dur_text = format_duration(duration)
-    dur_x = prog_max_x + int(6 / 1280 * W)
-    dur_y = prog_min_y + ((prog_max_y - prog_min_y) - dur_font.size) // 2
-    for ox, oy in [(0, 0), (1, 0)]:
-        draw.text((dur_x + ox, dur_y + oy), dur_text, font=dur_font, fill=dur_color)
-
-    Path(save_dir).parent.mkdir(parents=True, exist_ok=True)
-    await asyncio.to_thread(base_img.save, save_dir)
-    return save_dir if await aiopath.exists(save_dir) else ""
+    dur_x = L.dur_x
+    dur_y = L.prog_min_y + ((L.prog_max_y - L.prog_min_y) - dur_font.size) // 2
+    # Rasterize the text once, then stamp it twice one pixel apart for the faux-bold look
+    _, _, dur_w, dur_h = dur_font.getbbox(dur_text)
+    dur_mask = Image.new("L", (dur_w, dur_h), 0)
+    ImageDraw.Draw(dur_mask).text((0, 0), dur_text, font=dur_font, fill=255)
+    for ox in (0, 1):
+        base_img.paste(dur_color, (dur_x + ox, dur_y), dur_mask)
+
+    return base_img
+
+
+async def gen_thumb(song: CachedTrack) -> str:
+    cache_key = ThumbCache.key(song)
+    if cached := await thumb_cache.get(cache_key):
+        return cached
+
+    if _TEMPLATE_IMG is None:
+        LOGGER.error("Template image loading error.")
+        return ""
+
+    thumb_img = await fetch_image(song.thumbnail)
+    if not thumb_img:
+        LOGGER.error("No thumbnail for song %s", song.track_id)
+        return ""
+
+    # Pillow releases the GIL inside its heavy C loops, so a worker thread keeps the event loop responsive
+    base_img = await asyncio.to_thread(
+        _render_thumb,
+        thumb_img,
+        (song.name or "").strip() or "Unknown Title",
+        (song.artist or "Unknown Artist").strip(),
+        int(song.duration or 0),
+    )
+
+    try:
+        # The thumbnail is decorative; the fastest zlib level is plenty
+        return await thumb_cache.put(
+            cache_key, functools.partial(base_img.save, format="PNG", compress_level=1)
+        )
+    except OSError as e:
+        LOGGER.error("Thumbnail save error: %s", e)
+        return ""
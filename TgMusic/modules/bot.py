@@ -210,7 +210,7 @@ async def performance_cmd(client: Client, message: types.Message) -> None:
 
 📊 <b>Call Stats:</b>
 • Call Ping: <code>{call_ping_info}</code>
-• Active VCs: <code>{len(chat_cache.get_active_chats())}</code>
+• Active VCs: <code>{chat_cache.count_active_chats()}</code>
 """
         
         done = await reply_msg.edit_text(response, disable_web_page_preview=True)
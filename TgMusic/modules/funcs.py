@@ -27,12 +27,11 @@ async def set_play_type(_: Client, msg: types.Message) -> None:
     chat_cache.update_activity(chat_id)
 
     play_type = extract_argument(msg.text, enforce_digit=True)
-    if not play_type:
+    if play_type is None:
         text = "Usage: /setPlayType 0/1\n\n0 = Directly play the first search result.\n1 = Show a list of songs to choose from."
         await msg.reply_text(text)
         return
 
-    play_type = int(play_type)
     if play_type not in (0, 1):
         user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
         await msg.reply_text(language_manager.get_text("func_invalid_mode", user_lang))
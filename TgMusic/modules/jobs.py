@@ -4,7 +4,7 @@
 import asyncio
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from dataclasses import dataclass, field
 
 from pytdbot import Client, types
@@ -14,7 +14,7 @@ from pyrogram import errors
 from pyrogram.client import Client as PyroClient
 
 
-@dataclass
+@dataclass(slots=True)
 class JobMetrics:
     """Performance metrics for job operations."""
     vc_checks: int = 0
@@ -22,9 +22,9 @@ class JobMetrics:
     leave_operations: int = 0
     errors: int = 0
     total_runtime: float = 0.0
-    avg_processing_time: float = 0.0
     _processing_times: List[float] = field(default_factory=list)
     last_cleanup: float = field(default_factory=time.time)
+    sampling_enabled: bool = False  # Record per-operation processing times
 
     def record_vc_check(self, processing_time: float = 0.0):
         self.vc_checks += 1
@@ -45,7 +45,12 @@ class JobMetrics:
             self._processing_times.append(processing_time)
             if len(self._processing_times) > 100:  # Keep last 100 operations
                 self._processing_times.pop(0)
-            self.avg_processing_time = sum(self._processing_times) / len(self._processing_times)
+
+    @property
+    def avg_processing_time(self) -> float:
+        if not self._processing_times:
+            return 0.0
+        return sum(self._processing_times) / len(self._processing_times)
 
     def get_stats(self) -> Dict[str, Any]:
         return {
@@ -65,23 +70,26 @@ class OptimizedInactiveCallManager:
     def __init__(self, bot: Client):
         self.bot = bot
         self._stop = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._chat_cache_cleanup = None  # Resolved in start()
         self._vc_task: Optional[asyncio.Task] = None
         self._leave_task: Optional[asyncio.Task] = None
-        self._cleanup_task: Optional[asyncio.Task] = None
         
         # Performance settings
         self._sleep_time = 30  # Reduced for better responsiveness
         self._min_played_time = 15  # Minimum play time before auto-end
+        self._idle_cycles = 0  # Consecutive cycles without active chats
+        self._max_idle_sleep = 300  # Back-off ceiling while idle
         self._max_concurrent_operations = 5
         self._operation_timeout = 30
+        self._auto_end_ttl = 60  # Seconds to trust the cached auto-end flag
+        self._auto_end_cache: Optional[tuple[float, bool]] = None
         
         # Concurrency control
         self._semaphore = asyncio.Semaphore(self._max_concurrent_operations)
-        self._active_operations: Dict[str, asyncio.Task] = {}
-        self._operation_lock = asyncio.Lock()
         
         # Metrics and monitoring
-        self.metrics = JobMetrics()
+        self.metrics = JobMetrics(sampling_enabled=config.JOB_METRICS_SAMPLING)
         self._health_check_interval = 300  # 5 minutes
         self._last_health_check = time.time()
         
@@ -90,6 +98,14 @@ class OptimizedInactiveCallManager:
         self._consecutive_errors = 0
         self._error_backoff = 1.0
 
+    async def _interruptible_sleep(self, delay: float) -> bool:
+        """Sleep for up to ``delay`` seconds; return True if stop was requested."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=delay)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def _execute_with_timeout(self, operation, *args, **kwargs):
         """Execute operation with timeout and error handling."""
         try:
@@ -108,10 +124,21 @@ class OptimizedInactiveCallManager:
 
     async def _end_call_if_inactive(self, chat_id: int) -> bool:
         """Check and end inactive voice calls with enhanced error handling."""
-        start_time = time.time()
+        start_time = self._loop.time() if self.metrics.sampling_enabled else 0.0
         
         try:
             async with self._semaphore:  # Limit concurrent operations
+                # Check played time first, it is cheaper than listing VC users
+                played_time = await self._execute_with_timeout(call.played_time, chat_id)
+                if played_time is None or isinstance(played_time, types.Error):
+                    if isinstance(played_time, types.Error):
+                        LOGGER.warning("Played Time Error for chat %s: %s", chat_id, played_time.message)
+                    return False
+
+                # Don't end if track just started
+                if played_time < self._min_played_time:
+                    return False
+
                 # Check voice chat users
                 vc_users = await self._execute_with_timeout(call.vc_users, chat_id)
                 if vc_users is None or isinstance(vc_users, types.Error):
@@ -123,17 +150,6 @@ class OptimizedInactiveCallManager:
                 if len(vc_users) > 1:
                     return False
 
-                # Check played time
-                played_time = await self._execute_with_timeout(call.played_time, chat_id)
-                if played_time is None or isinstance(played_time, types.Error):
-                    if isinstance(played_time, types.Error):
-                        LOGGER.warning("Played Time Error for chat %s: %s", chat_id, played_time.message)
-                    return False
-
-                # Don't end if track just started
-                if played_time < self._min_played_time:
-                    return False
-
                 # End the call
                 try:
                     await self.bot.sendTextMessage(
@@ -155,32 +171,29 @@ class OptimizedInactiveCallManager:
             return False
             
         finally:
-            processing_time = time.time() - start_time
+            processing_time = self._loop.time() - start_time if start_time else 0.0
             self.metrics.record_vc_check(processing_time)
 
-    async def _process_chat_batch(self, chat_batch: List[int]) -> int:
+    async def _process_chat_batch(self, chat_batch: Sequence[int]) -> int:
         """Process a batch of chats concurrently with error handling."""
         if not chat_batch:
             return 0
             
         try:
-            # Create tasks for concurrent processing
-            tasks = [
-                asyncio.create_task(self._end_call_if_inactive(chat_id))
-                for chat_id in chat_batch
-            ]
-            
-            # Execute with timeout
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Count successful operations
-            ended_calls = sum(1 for result in results if result is True)
+            # One failing chat must not cancel the rest of the batch
+            results = await asyncio.gather(
+                *(self._end_call_if_inactive(chat_id) for chat_id in chat_batch),
+                return_exceptions=True,
+            )
             
-            # Log any exceptions
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    LOGGER.error("Error processing chat %s: %s", chat_batch[i], result)
+            # Count successful operations and log any exceptions
+            ended_calls = 0
+            for chat_id, result in zip(chat_batch, results):
+                if isinstance(result, BaseException):
+                    LOGGER.error("Error processing chat %s: %s", chat_id, result)
                     self.metrics.record_error()
+                elif result is True:
+                    ended_calls += 1
             
             return ended_calls
             
@@ -191,82 +204,96 @@ class OptimizedInactiveCallManager:
 
     async def _vc_loop(self):
         """Optimized voice chat monitoring loop with batch processing."""
-        loop_start_time = time.time()
+        loop_start_time = self._loop.time()
+        next_health_check = loop_start_time + self._health_check_interval
         
-        while not self._stop.is_set():
-            cycle_start = time.time()
+        try:
+            while not self._stop.is_set():
+                cycle_start = self._loop.time()
             
-            try:
-                # Health check
-                if self.bot.me is None:
-                    await asyncio.sleep(2)
-                    continue
+                # Piggyback periodic maintenance on this loop's wakeups
+                if cycle_start >= next_health_check:
+                    next_health_check = cycle_start + self._health_check_interval
+                    await self._run_health_check()
+            
+                try:
+                    # Health check
+                    if self.bot.me is None:
+                        await self._interruptible_sleep(2)
+                        continue
 
-                # Check if auto-end is enabled
-                if not await db.get_auto_end(self.bot.me.id):
-                    await asyncio.sleep(self._sleep_time)
-                    continue
+                    # Check if auto-end is enabled (cached, the flag rarely changes)
+                    now = self._loop.time()
+                    if self._auto_end_cache is None or now - self._auto_end_cache[0] > self._auto_end_ttl:
+                        self._auto_end_cache = (now, await db.get_auto_end(self.bot.me.id))
+                    if not self._auto_end_cache[1]:
+                        await self._interruptible_sleep(self._sleep_time)
+                        continue
 
-                # Get active chats
-                active_chats = chat_cache.get_active_chats()
-                if not active_chats:
-                    await asyncio.sleep(self._sleep_time)
-                    continue
+                    # Get active chats
+                    active_chats = chat_cache.iter_active_chats()
+                    total_chats = len(active_chats)
+                    if not total_chats:
+                        # Poll less often while the bot is idle
+                        self._idle_cycles = min(self._idle_cycles + 1, 10)
+                        await self._interruptible_sleep(min(self._sleep_time * self._idle_cycles, self._max_idle_sleep))
+                        continue
+
+                    self._idle_cycles = 0
 
-                LOGGER.debug("Processing %d active chats for auto-end", len(active_chats))
+                    LOGGER.debug("Processing %d active chats for auto-end", total_chats)
 
-                # Process chats in batches to avoid overwhelming the system
-                batch_size = min(10, self._max_concurrent_operations)
-                total_ended = 0
+                    # Process chats in batches to avoid overwhelming the system
+                    batch_size = min(10, self._max_concurrent_operations)
+                    total_ended = 0
                 
-                for i in range(0, len(active_chats), batch_size):
-                    batch = active_chats[i:i + batch_size]
-                    ended_calls = await self._process_chat_batch(batch)
-                    total_ended += ended_calls
+                    for i in range(0, total_chats, batch_size):
+                        batch = active_chats[i:i + batch_size]
+                        ended_calls = await self._process_chat_batch(batch)
+                        total_ended += ended_calls
                     
-                    # Small delay between batches
-                    if i + batch_size < len(active_chats):
-                        await asyncio.sleep(0.5)
+                        # Small delay between batches
+                        if i + batch_size < total_chats:
+                            if await self._interruptible_sleep(0.5):
+                                break
 
-                if total_ended > 0:
-                    LOGGER.info("Auto-ended %d inactive voice calls", total_ended)
+                    if total_ended > 0:
+                        LOGGER.info("Auto-ended %d inactive voice calls", total_ended)
 
-                # Reset consecutive errors on success
-                self._consecutive_errors = 0
-                self._error_backoff = 1.0
+                    # Reset consecutive errors on success
+                    self._consecutive_errors = 0
+                    self._error_backoff = 1.0
 
-            except Exception as e:
-                self._consecutive_errors += 1
-                self.metrics.record_error()
+                except Exception as e:
+                    self._consecutive_errors += 1
+                    self.metrics.record_error()
                 
-                LOGGER.exception("VC AutoEnd loop error (attempt %d): %s", 
-                               self._consecutive_errors, e)
+                    LOGGER.exception("VC AutoEnd loop error (attempt %d): %s", 
+                                   self._consecutive_errors, e)
                 
-                # Exponential backoff for consecutive errors
-                if self._consecutive_errors >= self._max_consecutive_errors:
-                    self._error_backoff = min(self._error_backoff * 2, 60)
-                    LOGGER.warning("Too many consecutive errors, backing off for %ss", 
-                                 self._error_backoff)
-                    await asyncio.sleep(self._error_backoff)
-                    self._consecutive_errors = 0
-
-            # Adaptive sleep time based on workload
-            cycle_time = time.time() - cycle_start
-            sleep_time = max(self._sleep_time - cycle_time, 5)
-            
-            await asyncio.sleep(sleep_time)
-
-        # Update total runtime
-        self.metrics.total_runtime = time.time() - loop_start_time
+                    # Exponential backoff for consecutive errors
+                    if self._consecutive_errors >= self._max_consecutive_errors:
+                        self._error_backoff = min(self._error_backoff * 2, 60)
+                        LOGGER.warning("Too many consecutive errors, backing off for %ss", 
+                                     self._error_backoff)
+                        await self._interruptible_sleep(self._error_backoff)
+                        self._consecutive_errors = 0
+
+                # Adaptive sleep time based on workload
+                cycle_time = self._loop.time() - cycle_start
+                sleep_time = max(self._sleep_time - cycle_time, 5)
+            
+                await self._interruptible_sleep(sleep_time)
+        finally:
+            # Update total runtime, also when stop() cancels the loop
+            self.metrics.total_runtime = self._loop.time() - loop_start_time
 
     async def _leave_loop(self):
         """Auto-leave loop with 1-day inactivity timer and activity detection."""
         while not self._stop.is_set():
             try:
                 # Check for inactive chats every 30 minutes
-                await asyncio.sleep(30 * 60)  # 30 minutes
-                
-                if self._stop.is_set():
+                if await self._interruptible_sleep(30 * 60):  # 30 minutes
                     break
 
                 # Get inactive chats (inactive for 1 day)
@@ -312,11 +339,8 @@ class OptimizedInactiveCallManager:
                 self.metrics.record_error()
                 
                 # Wait before retry to avoid tight error loop
-                try:
-                    await asyncio.wait_for(self._stop.wait(), timeout=3600)  # 1 hour
+                if await self._interruptible_sleep(3600):  # 1 hour
                     break
-                except asyncio.TimeoutError:
-                    continue
 
     async def _leave_inactive_chats(self, chat_ids: List[int]) -> int:
         """Leave specific inactive chats with enhanced error handling."""
@@ -324,7 +348,9 @@ class OptimizedInactiveCallManager:
             LOGGER.info("AutoLeave is disabled, skipping leave operation")
             return 0
 
-        start_time = time.time()
+        if self._loop is None:  # May run on an instance that was never started
+            self._loop = asyncio.get_running_loop()
+        start_time = self._loop.time()
         LOGGER.info("Starting leave operation for %d inactive chats", len(chat_ids))
 
         try:
@@ -376,7 +402,7 @@ class OptimizedInactiveCallManager:
                     processed_clients += 1
             
             # Log final statistics
-            duration = time.time() - start_time
+            duration = self._loop.time() - start_time
             LOGGER.info(
                 "Leave operation completed: %d clients processed, %d total chats left, %.2fs duration",
                 processed_clients, total_left, duration
@@ -390,7 +416,7 @@ class OptimizedInactiveCallManager:
             return 0
             
         finally:
-            duration = time.time() - start_time
+            duration = self._loop.time() - start_time
             LOGGER.info("Leave operation completed in %.2fs", duration)
 
     async def _process_inactive_chats_for_client(self, client_name: str, ub: PyroClient, chat_ids: List[int]) -> int:
@@ -432,100 +458,98 @@ class OptimizedInactiveCallManager:
             self.metrics.record_error()
             return 0
 
-    async def _leave_chat(self, ub: PyroClient, chat_id: int, retry_count: int = 0) -> bool:
+    async def _leave_chat(self, ub: PyroClient, chat_id: int) -> bool:
         """Leave a chat with enhanced error handling and retry logic."""
         max_retries = 3
-        start_time = time.time()
-        
-        try:
-            # Don't leave if chat is currently active
-            if chat_cache.is_active(chat_id):
-                return False
+
+        # Don't leave if chat is currently active
+        if chat_cache.is_active(chat_id):
+            return False
+
+        start_time = self._loop.time()
+
+        for attempt in range(max_retries + 1):
+            try:
+                # Execute leave operation with timeout
+                await asyncio.wait_for(ub.leave_chat(chat_id), timeout=10)
                 
-            # Execute leave operation with timeout
-            await asyncio.wait_for(ub.leave_chat(chat_id), timeout=10)
-            
-            processing_time = time.time() - start_time
-            self.metrics.record_leave_operation(processing_time)
-            
-            LOGGER.debug("Successfully left chat %s via %s (%.2fs)", 
-                        chat_id, ub.name, processing_time)
-            return True
-            
-        except errors.FloodWait as e:
-            wait_time = e.value
-            
-            # Only retry if wait time is reasonable and we haven't exceeded retries
-            if wait_time <= 100 and retry_count < max_retries:
+                processing_time = self._loop.time() - start_time
+                self.metrics.record_leave_operation(processing_time)
+                
+                LOGGER.debug("Successfully left chat %s via %s (%.2fs)", 
+                            chat_id, ub.name, processing_time)
+                return True
+                
+            except errors.FloodWait as e:
+                wait_time = e.value
+                
+                # Only retry if wait time is reasonable and we haven't exceeded retries
+                if wait_time > 100 or attempt == max_retries:
+                    LOGGER.error(
+                        "FloodWait too long (%ds) or max retries exceeded for chat %s via %s", 
+                        wait_time, chat_id, ub.name
+                    )
+                    self.metrics.record_error()
+                    return False
+
                 LOGGER.warning(
                     "FloodWait %ds for chat %s via %s (retry %d/%d)", 
-                    wait_time, chat_id, ub.name, retry_count + 1, max_retries
+                    wait_time, chat_id, ub.name, attempt + 1, max_retries
                 )
                 await asyncio.sleep(wait_time)
-                return await self._leave_chat(ub, chat_id, retry_count + 1)
-            else:
-                LOGGER.error(
-                    "FloodWait too long (%ds) or max retries exceeded for chat %s via %s", 
-                    wait_time, chat_id, ub.name
-                )
+                    
+            except errors.RPCError as e:
+                # Don't retry RPC errors, they're usually permanent
+                LOGGER.warning("RPC error leaving chat %s via %s: %s", chat_id, ub.name, e)
                 self.metrics.record_error()
                 return False
                 
-        except errors.RPCError as e:
-            # Don't retry RPC errors, they're usually permanent
-            LOGGER.warning("RPC error leaving chat %s via %s: %s", chat_id, ub.name, e)
-            self.metrics.record_error()
-            return False
-            
-        except asyncio.TimeoutError:
-            LOGGER.error("Timeout leaving chat %s via %s", chat_id, ub.name)
-            self.metrics.record_error()
-            return False
-            
-        except Exception as e:
-            LOGGER.exception("Unexpected error leaving chat %s via %s: %s", chat_id, ub.name, e)
-            self.metrics.record_error()
-            return False
+            except asyncio.TimeoutError:
+                LOGGER.error("Timeout leaving chat %s via %s", chat_id, ub.name)
+                self.metrics.record_error()
+                return False
+                
+            except Exception as e:
+                LOGGER.exception("Unexpected error leaving chat %s via %s: %s", chat_id, ub.name, e)
+                self.metrics.record_error()
+                return False
+
+        return False
 
     async def _process_client_dialogs(self, client_name: str, ub: PyroClient) -> int:
         """Process dialogs for a single client and leave inactive chats."""
         try:
             chats_to_leave = []
+            append = chats_to_leave.append
             
             # Collect chats to leave
             async for dialog in ub.get_dialogs():
-                chat = getattr(dialog, "chat", None)
-                if chat and chat.id > 0:
+                chat = dialog.chat
+                if chat is None or chat.id > 0:
                     continue  # Skip users/private chats
-                chats_to_leave.append(chat.id)
+                append(chat.id)
             
             LOGGER.info("Client %s: Found %d chats to process", client_name, len(chats_to_leave))
             
-            # Process chats in batches with rate limiting
+            # Leave chats with bounded concurrency to avoid rate limits
             successful_leaves = 0
-            batch_size = 5  # Smaller batches to avoid rate limits
+            semaphore = asyncio.Semaphore(5)
+            tasks: set[asyncio.Task] = set()
             
-            for i in range(0, len(chats_to_leave), batch_size):
-                batch = chats_to_leave[i:i + batch_size]
-                
-                # Process batch concurrently
-                tasks = [
-                    asyncio.create_task(self._leave_chat(ub, chat_id))
-                    for chat_id in batch
-                ]
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Count successful operations
-                for result in results:
-                    if result is True:
-                        successful_leaves += 1
-                    elif isinstance(result, Exception):
-                        LOGGER.error("Leave operation failed: %s", result)
-                
-                # Rate limiting between batches
-                if i + batch_size < len(chats_to_leave):
-                    await asyncio.sleep(2.0)
+            for chat_id in chats_to_leave:
+                await semaphore.acquire()
+                task = asyncio.create_task(self._leave_chat(ub, chat_id))
+                task.add_done_callback(lambda _: semaphore.release())
+                tasks.add(task)
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Count successful operations
+            for result in results:
+                if result is True:
+                    successful_leaves += 1
+                elif isinstance(result, Exception):
+                    LOGGER.error("Leave operation failed: %s", result)
             
             LOGGER.info("Client %s: Successfully left %d/%d chats", 
                        client_name, successful_leaves, len(chats_to_leave))
@@ -542,7 +566,9 @@ class OptimizedInactiveCallManager:
             LOGGER.info("AutoLeave is disabled, skipping leave_all operation")
             return
 
-        start_time = time.time()
+        if self._loop is None:  # May run on an instance that was never started
+            self._loop = asyncio.get_running_loop()
+        start_time = self._loop.time()
         LOGGER.info("Starting optimized leave_all operation")
 
         try:
@@ -577,91 +603,87 @@ class OptimizedInactiveCallManager:
                         return 0
             
             # Execute all client operations
-            tasks = [
-                asyncio.create_task(process_client_with_semaphore(client_data))
+            task_names = {
+                asyncio.create_task(process_client_with_semaphore(client_data)): client_data[0]
                 for client_data in available_clients
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            }
             
-            # Process results
-            for i, result in enumerate(results):
-                client_name = available_clients[i][0]
-                if isinstance(result, Exception):
-                    LOGGER.error("Client %s processing failed: %s", client_name, result)
-                    self.metrics.record_error()
-                else:
-                    total_left += result
-                    processed_clients += 1
+            # Process results as each client finishes
+            pending = set(task_names)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    client_name = task_names[task]
+                    error = asyncio.CancelledError() if task.cancelled() else task.exception()
+                    if error is not None:
+                        LOGGER.error("Client %s processing failed: %s", client_name, error)
+                        self.metrics.record_error()
+                    else:
+                        total_left += task.result()
+                        processed_clients += 1
+                        self.metrics.last_cleanup = time.time()
             
             # Log final statistics
-            duration = time.time() - start_time
+            duration = self._loop.time() - start_time
             LOGGER.info(
                 "Leave_all completed: %d clients processed, %d total chats left, %.2fs duration",
                 processed_clients, total_left, duration
             )
             
-            # Update metrics
-            self.metrics.last_cleanup = time.time()
-            
         except Exception as e:
             LOGGER.critical("Fatal error in leave_all operation: %s", e, exc_info=True)
             self.metrics.record_error()
             
         finally:
-            duration = time.time() - start_time
+            duration = self._loop.time() - start_time
             LOGGER.info("Leave_all operation completed in %.2fs", duration)
 
-    async def _health_check_loop(self):
-        """Periodic health check and maintenance loop."""
-        while not self._stop.is_set():
-            try:
-                await asyncio.sleep(self._health_check_interval)
-                
-                current_time = time.time()
-                
-                # Perform health checks
-                health_status = {
-                    "vc_task_running": self._vc_task and not self._vc_task.done(),
-                    "leave_task_running": self._leave_task and not self._leave_task.done(),
-                    "active_operations": len(self._active_operations),
-                    "consecutive_errors": self._consecutive_errors,
-                    "last_check": current_time,
-                }
-                
-                # Log health status
-                LOGGER.debug("Job manager health check: %s", health_status)
-                
-                # Clean up completed operations
-                async with self._operation_lock:
-                    completed_ops = [
-                        name for name, task in self._active_operations.items()
-                        if task.done()
-                    ]
-                    for name in completed_ops:
-                        del self._active_operations[name]
-                
-                if completed_ops:
-                    LOGGER.debug("Cleaned up %d completed operations", len(completed_ops))
-                
-                # Perform cache cleanup if needed
-                if hasattr(chat_cache, 'cleanup_inactive_chats'):
-                    cleaned = await chat_cache.cleanup_inactive_chats()
-                    if cleaned > 0:
-                        LOGGER.info("Health check cleaned up %d inactive chats", cleaned)
-                
-                self._last_health_check = current_time
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                LOGGER.error("Error in health check loop: %s", e)
-                self.metrics.record_error()
+    async def _run_health_check(self):
+        """Periodic health check and maintenance, run from the VC loop."""
+        try:
+            current_time = time.time()
+            
+            # Perform health checks
+            health_status = {
+                "vc_task_running": self._vc_task and not self._vc_task.done(),
+                "leave_task_running": self._leave_task and not self._leave_task.done(),
+                "active_operations": self._active_task_count(),
+                "consecutive_errors": self._consecutive_errors,
+                "last_check": current_time,
+            }
+            
+            # Log health status
+            LOGGER.debug("Job manager health check: %s", health_status)
+            
+            # Drop references to finished tasks
+            if self._leave_task and self._leave_task.done():
+                self._leave_task = None
+            
+            # Perform cache cleanup if needed
+            if self._chat_cache_cleanup is not None:
+                cleaned = await self._chat_cache_cleanup()
+                if cleaned > 0:
+                    LOGGER.info("Health check cleaned up %d inactive chats", cleaned)
+            
+            self._last_health_check = current_time
+            
+        except Exception as e:
+            LOGGER.error("Error in health check: %s", e)
+            self.metrics.record_error()
+
+    def _active_task_count(self) -> int:
+        """Count the background loops that are still running."""
+        return sum(
+            1 for task in (self._vc_task, self._leave_task)
+            if task and not task.done()
+        )
 
     async def start(self):
         """Start all job manager tasks with enhanced monitoring."""
         try:
             self._stop.clear()
+            self._loop = asyncio.get_running_loop()
+            self._chat_cache_cleanup = getattr(chat_cache, "cleanup_inactive_chats", None)
             
             # Start VC monitoring task
             if not self._vc_task or self._vc_task.done():
@@ -672,23 +694,9 @@ class OptimizedInactiveCallManager:
             if not self._leave_task or self._leave_task.done():
                 self._leave_task = asyncio.create_task(self._leave_loop())
                 LOGGER.info("Auto-leave loop started (scheduled for 3:00 AM daily)")
-            
-            # Start health check task
-            if not self._cleanup_task or self._cleanup_task.done():
-                self._cleanup_task = asyncio.create_task(self._health_check_loop())
-                LOGGER.info("Health check loop started (interval: %ds)", self._health_check_interval)
-
-            # Track active operations
-            async with self._operation_lock:
-                if self._vc_task:
-                    self._active_operations["vc_monitor"] = self._vc_task
-                if self._leave_task:
-                    self._active_operations["auto_leave"] = self._leave_task
-                if self._cleanup_task:
-                    self._active_operations["health_check"] = self._cleanup_task
 
             LOGGER.info("Job manager started successfully with %d active tasks", 
-                       len(self._active_operations))
+                       self._active_task_count())
             
         except Exception as e:
             LOGGER.error("Error starting job manager: %s", e)
@@ -710,47 +718,27 @@ class OptimizedInactiveCallManager:
                 tasks_to_stop.append(("vc_monitor", self._vc_task))
             if self._leave_task and not self._leave_task.done():
                 tasks_to_stop.append(("auto_leave", self._leave_task))
-            if self._cleanup_task and not self._cleanup_task.done():
-                tasks_to_stop.append(("health_check", self._cleanup_task))
             
             if not tasks_to_stop:
                 LOGGER.info("No active tasks to stop")
                 return
             
-            # Wait for tasks with timeout
-            try:
-                await asyncio.wait_for(
-                    asyncio.gather(*[task for _, task in tasks_to_stop], return_exceptions=True),
-                    timeout=timeout
-                )
+            # Loops honour _stop cooperatively, so cancel right away instead of
+            # waiting for them to reach their next stop check
+            for _, task in tasks_to_stop:
+                task.cancel()
+            
+            _, pending = await asyncio.wait(
+                [task for _, task in tasks_to_stop], timeout=timeout
+            )
+            if pending:
+                LOGGER.error("Some tasks failed to cancel within timeout")
+            else:
                 LOGGER.info("All tasks stopped gracefully")
-                
-            except asyncio.TimeoutError:
-                LOGGER.warning("Timeout waiting for tasks to stop, cancelling remaining tasks")
-                
-                # Cancel remaining tasks
-                for name, task in tasks_to_stop:
-                    if not task.done():
-                        LOGGER.warning("Cancelling task: %s", name)
-                        task.cancel()
-                
-                # Wait a bit more for cancellation
-                try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*[task for _, task in tasks_to_stop], return_exceptions=True),
-                        timeout=5.0
-                    )
-                except asyncio.TimeoutError:
-                    LOGGER.error("Some tasks failed to cancel within timeout")
             
             # Clear task references
             self._vc_task = None
             self._leave_task = None
-            self._cleanup_task = None
-            
-            # Clear active operations
-            async with self._operation_lock:
-                self._active_operations.clear()
             
             stop_time = time.time() - start_time
             LOGGER.info("Job manager stopped in %.2fs", stop_time)
@@ -774,10 +762,6 @@ class OptimizedInactiveCallManager:
                         "running": self._leave_task and not self._leave_task.done(),
                         "task_id": id(self._leave_task) if self._leave_task else None,
                     },
-                    "health_check": {
-                        "running": self._cleanup_task and not self._cleanup_task.done(),
-                        "task_id": id(self._cleanup_task) if self._cleanup_task else None,
-                    },
                 },
                 "settings": {
                     "sleep_time": self._sleep_time,
@@ -790,7 +774,7 @@ class OptimizedInactiveCallManager:
                     "consecutive_errors": self._consecutive_errors,
                     "error_backoff": self._error_backoff,
                 },
-                "active_operations": len(self._active_operations),
+                "active_operations": self._active_task_count(),
                 **self.metrics.get_stats(),
             }
         except Exception as e:
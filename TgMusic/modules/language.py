@@ -3,40 +3,67 @@
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 #  Modified by Devin - Major modifications and improvements
 
+from functools import lru_cache
+
+from cachetools import TTLCache
 from pytdbot import Client, types
 from TgMusic.core import Filter, language_manager
 from TgMusic.core._database import db
 
+# Last rendered /language menu per (chat, user); absorbs repeated commands
+_lang_render_cache = TTLCache(maxsize=1000, ttl=2)
+_SUPPORTED_CODES = frozenset(language_manager.get_supported_languages())
+_INVALID_LANG_MSG = language_manager.get_text(
+    "error_invalid_request", language=language_manager.DEFAULT_LANGUAGE
+)
+
+
+@lru_cache(maxsize=256)
+def _lang_btn(lang_code: str, is_current: bool, lang_name: str) -> types.InlineKeyboardButton:
+    """Build a single language button; interned per (code, current) pair."""
+    # Add checkmark for current language
+    prefix = "✅ " if is_current else "🌐 "
+    return types.InlineKeyboardButton(
+        text=f"{prefix}{lang_name}",
+        type=types.InlineKeyboardButtonTypeCallback(f"lang_{lang_code}".encode()),
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_lang_keyboard(current_lang: str) -> types.ReplyMarkupInlineKeyboard:
+    """Build the language selection keyboard, marking the current language."""
+    keyboard = [
+        [_lang_btn(lang_code, lang_code == current_lang, lang_name)]
+        for lang_code, lang_name in language_manager.get_supported_languages().items()
+    ]
+    
+    # Add back button
+    keyboard.append([
+        types.InlineKeyboardButton(
+            text=language_manager.get_text("back_button", language=current_lang),
+            type=types.InlineKeyboardButtonTypeCallback(b"lang_back"),
+        )
+    ])
+    
+    return types.ReplyMarkupInlineKeyboard(keyboard)
+
 
 @Client.on_message(filters=Filter.command("language"))
 async def language_cmd(c: Client, message: types.Message) -> None:
     """Handle /language command to change bot language."""
     user_id = message.from_id
     chat_id = message.chat_id
+    cache_key = (chat_id, user_id)
+    if cached := _lang_render_cache.get(cache_key):
+        text, reply_markup = cached
+        await message.reply_text(text, reply_markup=reply_markup)
+        return
     
     # Get current language (prioritize chat language for groups)
     current_lang = await language_manager.get_language(user_id, chat_id)
     current_lang_name = language_manager.get_supported_languages()[current_lang]
     
-    # Create language selection keyboard
-    keyboard = []
-    supported_langs = language_manager.get_supported_languages()
-    
-    for lang_code, lang_name in supported_langs.items():
-        # Add checkmark for current language
-        prefix = "✅ " if lang_code == current_lang else "🌐 "
-        keyboard.append([{
-            "text": f"{prefix}{lang_name}",
-            "callback_data": f"lang_{lang_code}"
-        }])
-    
-    # Add back button
-    keyboard.append([{
-        "text": language_manager.get_text("back_button", language=current_lang),
-        "callback_data": "lang_back"
-    }])
-    
-    reply_markup = types.ReplyMarkupInlineKeyboard(keyboard)
+    reply_markup = _build_lang_keyboard(current_lang)
     
     # Send language selection message
     title = language_manager.get_text("language_title", language=current_lang)
@@ -44,60 +71,48 @@ async def language_cmd(c: Client, message: types.Message) -> None:
     select_text = language_manager.get_text("language_select", language=current_lang)
     
     text = f"{title}\n\n{current_text}\n\n{select_text}"
+    _lang_render_cache[cache_key] = (text, reply_markup)
     
     await message.reply_text(text, reply_markup=reply_markup)
 
 
-@Client.on_updateNewCallbackQuery(filters=Filter.regex(r"lang_\w+"))
+@Client.on_updateNewCallbackQuery(filters=Filter.regex(r"^lang_(?:[a-z]{2,3}-[A-Z]{2}|back)$"))
 async def language_callback(c: Client, message: types.UpdateNewCallbackQuery) -> None:
     """Handle language selection callback queries."""
     data = message.payload.data.decode()
     user_id = message.sender_user_id
     chat_id = message.chat_id
     
+    # Extract and validate the language code before touching the database
+    lang_code = data.removeprefix("lang_")
+    if data != "lang_back" and lang_code not in _SUPPORTED_CODES:
+        await message.answer(_INVALID_LANG_MSG)
+        return
+    
+    current_lang = await language_manager.get_language(user_id, chat_id)
+    
     if data == "lang_back":
         # Go back to start menu
-        await message.answer(language_manager.get_text("back_button", language=await language_manager.get_language(user_id, chat_id)))
+        await message.answer(language_manager.get_text("back_button", language=current_lang))
         # Get user info for proper welcome message
         user = await c.getUser(user_id)
-        welcome_text = language_manager.get_text("start_welcome", language=await language_manager.get_language(user_id, chat_id), 
+        welcome_text = language_manager.get_text("start_welcome", language=current_lang, 
                                                user_name=user.first_name, bot_name=c.me.first_name, version="1.0")
         await message.edit_message_caption(welcome_text, reply_markup=None)
         return
     
-    # Extract language code
-    lang_code = data.replace("lang_", "")
-    
-    if not language_manager.is_supported_language(lang_code):
-        await message.answer(language_manager.get_text("error_invalid_request", language=await language_manager.get_language(user_id, chat_id)))
-        return
-    
     try:
         # Set language preference (chat language for groups, user language for private)
         success = await language_manager.set_language(user_id, lang_code, chat_id)
         
         if success:
+            _lang_render_cache.pop((chat_id, user_id), None)
             lang_name = language_manager.get_supported_languages()[lang_code]
             success_msg = language_manager.get_text("language_changed", language=lang_code, lang_name=lang_name)
             await message.answer(success_msg, show_alert=True)
             
             # Update the language selection message
-            keyboard = []
-            supported_langs = language_manager.get_supported_languages()
-            
-            for code, name in supported_langs.items():
-                prefix = "✅ " if code == lang_code else "🌐 "
-                keyboard.append([{
-                    "text": f"{prefix}{name}",
-                    "callback_data": f"lang_{code}"
-                }])
-            
-            keyboard.append([{
-                "text": language_manager.get_text("back_button", language=lang_code),
-                "callback_data": "lang_back"
-            }])
-            
-            reply_markup = types.ReplyMarkupInlineKeyboard(keyboard)
+            reply_markup = _build_lang_keyboard(lang_code)
             
             title = language_manager.get_text("language_title", language=lang_code)
             current_text = language_manager.get_text("language_current", language=lang_code, lang_name=lang_name)
@@ -108,10 +123,10 @@ async def language_callback(c: Client, message: types.UpdateNewCallbackQuery) ->
             await message.edit_message_caption(text, reply_markup=reply_markup)
             
         else:
-            error_msg = language_manager.get_text("language_error", language=await language_manager.get_language(user_id, chat_id))
+            error_msg = language_manager.get_text("language_error", language=current_lang)
             await message.answer(error_msg, show_alert=True)
             
     except Exception as e:
         c.logger.error(f"Error changing language for user {user_id}: {e}")
-        error_msg = language_manager.get_text("language_error", language=await language_manager.get_language(user_id, chat_id))
+        error_msg = language_manager.get_text("language_error", language=current_lang)
         await message.answer(error_msg, show_alert=True) 
\ No newline at end of file
@@ -25,8 +25,8 @@ async def modify_loop(c: Client, msg: types.Message) -> None:
         await msg.reply_text("⏸ No track currently playing")
         return
 
-    args = extract_argument(msg.text, enforce_digit=True)
-    if not args:
+    loop = extract_argument(msg.text, enforce_digit=True)
+    if loop is None:
         await msg.reply_text(
             "🔁 <b>Loop Control</b>\n\n"
             "Usage: <code>/loop [count]</code>\n"
@@ -35,7 +35,6 @@ async def modify_loop(c: Client, msg: types.Message) -> None:
         )
         return
 
-    loop = int(args)
     if loop < 0 or loop > 10:
         user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
         await msg.reply_text(language_manager.get_text("loop_range_error", user_lang))
@@ -3,7 +3,8 @@
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 #  Modified by Devin - Major modifications and improvements
 
-import re
+import asyncio
+from functools import lru_cache
 
 from pytdbot import Client, types
 
@@ -35,28 +36,71 @@ from TgMusic.modules.utils.play_helpers import (
 from TgMusic.core.thumbnails import gen_thumb
 
 
+_NOW_PLAYING_TMPL = (
+    "<blockquote>🎵 <b>Now Playing</b>\n"
+    "🎼 <b>Title:</b> <code>{name}</code>\n"
+    "\n"
+    "🕒 <b>Duration:</b> {duration}\n"
+    "🙋 <b>Requested by:</b> {user}</blockquote>\n"
+    "\n"
+    "-▸ Powered by {bot_name} ⚡"
+).format
+
+_ADDED_TO_QUEUE_TMPL = (
+    "<b>🎧 Added to Queue (#{position})</b>\n\n"
+    "▫ <b>Track:</b> <a href='{url}'>{name}</a>\n"
+    "▫ <b>Duration:</b> {duration}\n"
+    "▫ <b>Requested by:</b> {user}"
+).format
+
+_QUEUE_HEADER = "╭─────────────⭓\n📥 <b>Added to Queue</b>\n"
+_QUEUE_ITEM_TMPL = (
+    "┣▹ 🎼 <b>{position}.</b> <code>{name}</code>\n┣▹ 🕒 <b>Duration:</b> {duration}"
+).format
+_QUEUE_SUMMARY_TMPL = (
+    "╰▹ 📊 <b>Total in Queue:</b> {total}\n"
+    "╰▹ ⏱ <b>Total Duration:</b> {duration}\n"
+    "╰▹ 🙋 <b>Requested by:</b> {user}"
+).format
+
+_ME: tuple[int, str] | None = None
+
+_JIO_STRIP_TABLE = str.maketrans("", "", '()"\',')
+
+
+def _get_me(c: Client) -> tuple[int, str]:
+    """Return the bot's (id, first_name), resolved once after startup."""
+    global _ME
+    if _ME is None:
+        _ME = (c.me.id, c.me.first_name)
+    return _ME
+
+
+@lru_cache(maxsize=4096)
 def _get_jiosaavn_url(track_id: str) -> str:
     """Generate JioSaavn URL from track ID."""
     try:
         title, song_id = track_id.rsplit("/", 1)
     except ValueError:
         return ""
-    title = re.sub(r'[\(\)"\',]', "", title.lower()).replace(" ", "-")
+    title = title.lower().translate(_JIO_STRIP_TABLE).replace(" ", "-")
     return f"https://www.jiosaavn.com/song/{title}/{song_id}"
 
 
+@lru_cache(maxsize=4096)
 def _get_platform_url(platform: str, track_id: str) -> str:
     """Generate platform URL from track ID based on platform."""
     platform = platform.lower()
     if not track_id:
         return ""
 
-    platform_urls = {
-        "youtube": f"https://youtube.com/watch?v={track_id}",
-        "spotify": f"https://open.spotify.com/track/{track_id}",
-        "jiosaavn": _get_jiosaavn_url(track_id),
-    }
-    return platform_urls.get(platform, "")
+    if platform == "youtube":
+        return f"https://youtube.com/watch?v={track_id}"
+    if platform == "spotify":
+        return f"https://open.spotify.com/track/{track_id}"
+    if platform == "jiosaavn":
+        return _get_jiosaavn_url(track_id)
+    return ""
 
 
 def build_song_selection_message(
@@ -67,10 +111,8 @@ def build_song_selection_message(
     buttons = [
         [
             types.InlineKeyboardButton(
-                text=f"{track.name[:18]} - {track.artist}",
-                type=types.InlineKeyboardButtonTypeCallback(
-                    f"play_{track.platform.lower()}_{track.id}".encode()
-                ),
+                text=f"{track.button_name} - {track.artist}",
+                type=types.InlineKeyboardButtonTypeCallback(track.cb_play),
             )
         ]
         for track in tracks[:4]  # Show first 4 results
@@ -115,8 +157,16 @@ async def _handle_single_track(
     user_by: str,
     file_path: str = None,
     is_video: bool = False,
+    user_lang: str = None,
 ):
     chat_id = msg.chat_id
+    if user_lang is None:
+        settings, user_lang = await asyncio.gather(
+            db.get_chat_settings(chat_id),
+            language_manager.get_language(msg.from_id, chat_id),
+        )
+    else:
+        settings = await db.get_chat_settings(chat_id)
     song = CachedTrack(
         name=track.name,
         artist=track.artist,
@@ -134,7 +184,6 @@ async def _handle_single_track(
     # Download track if not already cached
     if not song.file_path:
         download_result = await call.song_download(song, msg)
-        user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
         if isinstance(download_result, types.Error):
             return await edit_text(
                 msg, language_manager.get_text("playback_download_failed", user_lang, error=download_result.message)
@@ -152,20 +201,21 @@ async def _handle_single_track(
         queue = chat_cache.get_queue(chat_id)
         chat_cache.add_song(chat_id, song)
 
-        queue_info = (
-            f"<b>🎧 Added to Queue (#{len(queue)})</b>\n\n"
-            f"▫ <b>Track:</b> <a href='{song.url}'>{song.name}</a>\n"
-            f"▫ <b>Duration:</b> {sec_to_min(song.duration)}\n"
-            f"▫ <b>Requested by:</b> {song.user}"
+        queue_info = _ADDED_TO_QUEUE_TMPL(
+            position=len(queue),
+            url=song.url,
+            name=song.name,
+            duration=sec_to_min(song.duration),
+            user=song.user,
         )
 
-        thumb = await gen_thumb(song) if await db.get_thumbnail_status(chat_id) else ""
+        thumb = await gen_thumb(song) if settings.thumbnail else ""
         return await _update_msg_with_thumb(
             c,
             msg,
             queue_info,
             thumb,
-            control_buttons("play") if await db.get_buttons_status(chat_id) else None,
+            control_buttons("play") if settings.buttons else None,
         )
 
     # Start new playback session
@@ -174,20 +224,15 @@ async def _handle_single_track(
 
     play_result = await call.play_media(chat_id, song.file_path, video=is_video)
     if isinstance(play_result, types.Error):
-        user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
         return await edit_text(msg, text=language_manager.get_text("playback_error", user_lang, error=play_result.message))
 
     # Prepare now playing message
-    thumb = await gen_thumb(song) if await db.get_thumbnail_status(chat_id) else ""
-    user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
-    bot_name = c.me.first_name
-    now_playing = (f"""<blockquote>🎵 <b>Now Playing</b>
-🎼 <b>Title:</b> <code>{song.name}</code>
-
-🕒 <b>Duration:</b> {sec_to_min(song.duration)}
-🙋 <b>Requested by:</b> {song.user}</blockquote>
-
--▸ Powered by {bot_name} ⚡"""
+    thumb = await gen_thumb(song) if settings.thumbnail else ""
+    now_playing = _NOW_PLAYING_TMPL(
+        name=song.name,
+        duration=sec_to_min(song.duration),
+        user=song.user,
+        bot_name=_get_me(c)[1],
     )
 
     update_result = await _update_msg_with_thumb(
@@ -195,7 +240,7 @@ async def _handle_single_track(
         msg,
         now_playing,
         thumb,
-        control_buttons("play") if await db.get_buttons_status(chat_id) else None,
+        control_buttons("play") if settings.buttons else None,
     )
 
     if isinstance(update_result, types.Error):
@@ -211,12 +256,14 @@ async def _handle_multiple_tracks(
     is_active = chat_cache.is_active(chat_id)
     queue = chat_cache.get_queue(chat_id)
 
-    queue_header = "╭─────────────⭓\n📥 <b>Added to Queue</b>\n"
     queue_items = []
+    overflow = False
+    acc_len = len(_QUEUE_HEADER)
+    added_duration = 0
 
     for index, track in enumerate(tracks):
         position = len(queue) + index
-        chat_cache.add_song(
+        added = chat_cache.add_song(
             chat_id,
             CachedTrack(
                 name=track.name,
@@ -232,21 +279,29 @@ async def _handle_multiple_tracks(
                 url=track.url,
             ),
         )
-        queue_items.append(
-            f"┣▹ 🎼 <b>{position}.</b> <code>{track.name}</code>\n┣▹ 🕒 <b>Duration:</b> {sec_to_min(track.duration)}"
-        )
-
-    queue_summary = (
-        f"╰▹ 📊 <b>Total in Queue:</b> {len(chat_cache.get_queue(chat_id))}\n"
-        f"╰▹ ⏱ <b>Total Duration:</b> {sec_to_min(sum(t.duration for t in tracks))}\n"
-        f"╰▹ 🙋 <b>Requested by:</b> {user_by}"
+        if added is not None:
+            added_duration += added.duration or 0
+        if overflow:
+            continue  # Past the message limit, only queue the remaining tracks
+
+        item = _QUEUE_ITEM_TMPL(position=position, name=track.name, duration=sec_to_min(track.duration))
+        acc_len += len(item) + 1
+        if acc_len > 4096:
+            overflow = True
+            continue
+        queue_items.append(item)
+
+    queue_summary = _QUEUE_SUMMARY_TMPL(
+        total=chat_cache.get_queue_length(chat_id),
+        duration=sec_to_min(added_duration),
+        user=user_by,
     )
 
-    full_message = queue_header + "\n".join(queue_items) + queue_summary
-
     # Handle message length limit
-    if len(full_message) > 4096:
+    if overflow or acc_len + len(queue_summary) > 4096:
         full_message = queue_summary
+    else:
+        full_message = _QUEUE_HEADER + "\n".join(queue_items) + queue_summary
 
     if not is_active:
         await call.play_next(chat_id)
@@ -261,17 +316,19 @@ async def play_music(
     user_by: str,
     tg_file_path: str = None,
     is_video: bool = False,
+    user_lang: str = None,
 ):
     """Main music playback handler for both single tracks and playlists."""
     if not url_data or not url_data.tracks:
-        user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
+        if user_lang is None:
+            user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
         return await edit_text(msg, language_manager.get_text("playback_no_tracks", user_lang))
 
     await edit_text(msg, text="🔍")
 
     if len(url_data.tracks) == 1:
         return await _handle_single_track(
-            c, msg, url_data.tracks[0], user_by, tg_file_path, is_video
+            c, msg, url_data.tracks[0], user_by, tg_file_path, is_video, user_lang
         )
     return await _handle_multiple_tracks(msg, url_data.tracks, user_by)
 
@@ -326,7 +383,7 @@ async def _handle_text_search(
 ):
     """Handle text-based music searches."""
     chat_id = msg.chat_id
-    play_type = await db.get_play_type(chat_id)
+    play_type = (await db.get_chat_settings(chat_id)).play_type
 
     search_result = await wrapper.search()
     if isinstance(search_result, types.Error):
@@ -405,7 +462,7 @@ async def handle_play_command(c: Client, msg: types.Message, is_video: bool = Fa
 
         # Verify bot admin status
         await load_admin_cache(c, chat_id)
-        if not await is_admin(chat_id, c.me.id):
+        if not await is_admin(chat_id, _get_me(c)[0]):
             metrics_manager.bot_metrics.record_command("play", success=False, error="admin_required")
             return await msg.reply_text(
                 language_manager.get_text("playback_admin_required", user_lang)
@@ -494,7 +551,7 @@ async def handle_play_command(c: Client, msg: types.Message, is_video: bool = Fa
                 metrics_manager.bot_metrics.record_command("play", success=False, error="track_info_exception")
                 return await edit_text(status_msg, text="❌ Error retrieving track information")
 
-            return await play_music(c, status_msg, track_info, requester, is_video=is_video)
+            return await play_music(c, status_msg, track_info, requester, is_video=is_video, user_lang=user_lang)
 
         # Handle text search for audio only
         if not is_video:
@@ -528,7 +585,7 @@ async def handle_play_command(c: Client, msg: types.Message, is_video: bool = Fa
                     reply_markup=SupportButton,
                 )
 
-            return await play_music(c, status_msg, video_info, requester, is_video=True)
+            return await play_music(c, status_msg, video_info, requester, is_video=True, user_lang=user_lang)
             
         except Exception as e:
             LOGGER.error(f"Error in video search: {e}")
@@ -540,7 +597,6 @@ async def handle_play_command(c: Client, msg: types.Message, is_video: bool = Fa
         LOGGER.error(f"Error in play command for chat {chat_id}: {e}", exc_info=True)
         
         # Send user-friendly error message
-        user_lang = await language_manager.get_language(msg.from_id, chat_id)
         error_response = ErrorResponse.from_exception(e, user_friendly=True)
         await reply_auto_delete_message(
             c, msg,
@@ -3,12 +3,32 @@
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 #  Modified by Devin - Major modifications and improvements
 
+import io
+from typing import Union
+
+from cachetools import TTLCache
 from pytdbot import Client, types
 
 from TgMusic.core import Filter, language_manager, chat_cache, call
 from TgMusic.modules.utils import sec_to_min
 from .utils.play_helpers import reply_auto_delete_message
 
+# Chat titles rarely change; avoid a getChat round-trip on every /queue
+_chat_title_cache = TTLCache(maxsize=1000, ttl=60)
+
+
+async def _get_chat_title(msg: types.Message) -> Union[str, types.Error]:
+    """Return the chat title, served from a short-lived cache when possible."""
+    if title := _chat_title_cache.get(msg.chat_id):
+        return title
+
+    chat = await msg.getChat()
+    if isinstance(chat, types.Error):
+        return chat
+
+    _chat_title_cache[msg.chat_id] = chat.title
+    return chat.title
+
 
 @Client.on_message(filters=Filter.command("queue"))
 async def queue_info(_: Client, msg: types.Message) -> None:
@@ -27,56 +47,65 @@ async def queue_info(_: Client, msg: types.Message) -> None:
         await reply_auto_delete_message(_, msg, "⏸ No active playback session.", delay=10)
         return
 
-    chat = await msg.getChat()
-    if isinstance(chat, types.Error):
+    # Repeated /queue within the window reuses the last render without any API calls
+    if cached := chat_cache.queue_render_cache.get(chat_id):
+        await reply_auto_delete_message(_, msg, text=cached, delay=10, disable_web_page_preview=True)
+        return
+
+    chat_title = await _get_chat_title(msg)
+    if isinstance(chat_title, types.Error):
         user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
         await reply_auto_delete_message(
             _, msg,
-            language_manager.get_text("queue_chat_error", user_lang, error=chat.message),
+            language_manager.get_text("queue_chat_error", user_lang, error=chat_title.message),
             delay=10
         )
         return
 
     current_song = _queue[0]
-    text = [
-        f"<b>🎧 Queue for {chat.title}</b>",
-        "",
-        "╭─────────────⭓",
-        "🎶 <b>Now Playing</b>",
-        f"┣▹ 🎼 <b>Title:</b> <code>{current_song.name[:45]}</code>",
-        "",
-        f"┣▹ 🕒 <b>Duration:</b> {sec_to_min(current_song.duration)}",
-        f"┣▹ 🔁 <b>Loop:</b> {'On' if current_song.loop else 'Off'}",
-        f"┣▹ ⏱ <b>Progress:</b> {sec_to_min(await call.played_time(chat.id))}",
-        f"╰▹ 🙋 <b>Requested by:</b> {current_song.user}",
-    ]
+    played_time = sec_to_min(await call.played_time(chat_id))
+    header = (
+        f"<b>🎧 Queue for {chat_title}</b>\n"
+        "\n"
+        "╭─────────────⭓\n"
+        "🎶 <b>Now Playing</b>\n"
+        f"┣▹ 🎼 <b>Title:</b> <code>{current_song.display_name}</code>\n"
+    )
+    total = f"<b>📊 Total:</b> {len(_queue)} track(s) in queue"
+
+    buf = io.StringIO()
+    w = buf.write
+    w(header)
+    w("\n")
+    w(f"┣▹ 🕒 <b>Duration:</b> {sec_to_min(current_song.duration)}\n")
+    w(f"┣▹ 🔁 <b>Loop:</b> {'On' if current_song.loop else 'Off'}\n")
+    w(f"┣▹ ⏱ <b>Progress:</b> {played_time}\n")
+    w(f"╰▹ 🙋 <b>Requested by:</b> {current_song.user}\n")
 
     if len(_queue) > 1:
-        text.extend(["", f"<b>⏭ Next Up ({len(_queue) - 1}):</b>"])
-        text.extend(
-            f"{i}. <code>{song.name[:45]}</code> | {sec_to_min(song.duration)} min"
-            for i, song in enumerate(_queue[1:11], 1)
-        )
+        w(f"\n<b>⏭ Next Up ({len(_queue) - 1}):</b>\n")
+        to_min = sec_to_min
+        durations = chat_cache.get_durations(chat_id)[1:11]
+        names = [song.display_name for song in _queue[1:11]]
+        for i, (name, duration) in enumerate(zip(names, durations), 1):
+            w(f"{i}. <code>{name}</code> | {to_min(duration)} min\n")
         if len(_queue) > 11:
-            text.append(f"...and {len(_queue) - 11} more")
+            w(f"...and {len(_queue) - 11} more\n")
 
-    text.append(f"\n<b>📊 Total:</b> {len(_queue)} track(s) in queue")
+    w(f"\n{total}")
 
     # Handle message length limit
-    formatted_text = "\n".join(text)
-    if len(formatted_text) > 4096:
-        formatted_text = "\n".join(
-            [
-                f"<b>🎧 Queue for {chat.title}</b>",
-                "",
-                "╭─────────────⭓",
-                "🎶 <b>Now Playing</b>",
-                f"┣▹ 🎼 <b>Title:</b> <code>{current_song.name[:45]}</code>",
-                f"┣▹ ⏱ <b>Progress:</b> {sec_to_min(await call.played_time(chat.id))}/{sec_to_min(current_song.duration)}",
-                f"╰▹ 🙋 <b>Requested by:</b> {current_song.user}",
-                "",
-                f"<b>📊 Total:</b> {len(_queue)} track(s) in queue",
-            ]
+    if buf.tell() > 4096:
+        formatted_text = (
+            f"{header}"
+            f"┣▹ ⏱ <b>Progress:</b> {played_time}/{sec_to_min(current_song.duration)}\n"
+            f"╰▹ 🙋 <b>Requested by:</b> {current_song.user}\n"
+            "\n"
+            f"{total}"
         )
+    else:
+        formatted_text = buf.getvalue()
+
+    chat_cache.queue_render_cache[chat_id] = formatted_text
 
     await reply_auto_delete_message(_, msg, text=formatted_text, delay=10, disable_web_page_preview=True)
@@ -17,7 +17,7 @@ async def remove_song(c: Client, msg: types.Message) -> None:
     if chat_id > 0:
         return None
 
-    args = extract_argument(msg.text, enforce_digit=True)
+    track_num = extract_argument(msg.text, enforce_digit=True)
 
     if not await is_admin(chat_id, msg.from_id):
         await reply_auto_delete_message(c, msg, "⛔ Administrator privileges required.", delay=10)
@@ -27,7 +27,7 @@ async def remove_song(c: Client, msg: types.Message) -> None:
         await reply_auto_delete_message(c, msg, "⏸ No active playback session.", delay=10)
         return None
 
-    if not args:
+    if track_num is None:
         await reply_auto_delete_message(
             c, msg,
             "ℹ️ <b>Usage:</b> <code>/remove [track_number]</code>\n"
@@ -36,17 +36,6 @@ async def remove_song(c: Client, msg: types.Message) -> None:
         )
         return None
 
-    try:
-        track_num = int(args)
-    except ValueError:
-        user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
-        await reply_auto_delete_message(
-            c, msg, 
-            language_manager.get_text("remove_invalid_number", user_lang),
-            delay=10
-        )
-        return None
-
     _queue = chat_cache.get_queue(chat_id)
 
     if not _queue:
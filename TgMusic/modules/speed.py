@@ -12,9 +12,12 @@ from TgMusic.core import Filter, language_manager, chat_cache, call
 from TgMusic.core.admins import is_admin
 
 
+_NUM_RE = re.compile(r"[-+]?\d*\.?\d+")
+
+
 def extract_number(text: str) -> float | None:
     """Extract a numerical value from text."""
-    match = re.search(r"[-+]?\d*\.?\d+", text)
+    match = _NUM_RE.search(text)
     return float(match.group()) if match else None
 
 
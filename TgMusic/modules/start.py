@@ -3,6 +3,8 @@
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 #  Modified by Devin - Major modifications and improvements
 
+import asyncio
+
 from pytdbot import Client, types
 
 from TgMusic import __version__
@@ -15,6 +17,7 @@ from TgMusic.core import (
     chat_cache,
 )
 from TgMusic.core.buttons import add_me_markup, HelpMenu, BackHelpMenu
+from TgMusic.logger import LOGGER
 
 startText = """
 ʜᴇʏ {};
@@ -28,6 +31,36 @@ startText = """
 ◎ ᴄʟɪᴄᴋ ᴏɴ ᴛʜᴇ ʜᴇʟᴘ ʙᴜᴛᴛᴏɴ ᴛᴏ ɢᴇᴛ ɪɴꜰᴏʀᴍᴀᴛɪᴏɴ ᴀʙᴏᴜᴛ ᴍʏ ᴍᴏᴅᴜʟᴇꜱ ᴀɴᴅ ᴄᴏᴍᴍᴀɴᴅꜱ.
 """
 
+_START_HEAD, _START_MID, _START_TAIL = startText.split("{}")
+
+
+def _start_caption(user_name: str, bot_name: str) -> str:
+    """Fill startText by joining its pre-split pieces instead of re-parsing it."""
+    return "".join((_START_HEAD, user_name, _START_MID, bot_name, _START_TAIL))
+
+
+# Fire-and-forget activity writes; the loop only keeps weak references to tasks
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        LOGGER.warning("Background chat activity update failed: %s", exc)
+
+
+# Help category callback data -> (title key, content key)
+_HELP_CATEGORY_KEYS = {
+    "help_user": ("help_user_title", "help_user_content"),
+    "help_admin": ("help_admin_title", "help_admin_content"),
+    "help_owner": ("help_owner_title", "help_owner_content"),
+    "help_devs": ("help_devs_title", "help_devs_content"),
+}
+
+# (language, category) -> (title, caption, markup); only known categories are stored
+_HELP_CAPTIONS: dict[tuple[str, str], tuple[str, str, types.ReplyMarkupInlineKeyboard]] = {}
+
+
 @Client.on_message(filters=Filter.command(["start", "help"]))
 async def start_cmd(c: Client, message: types.Message):
     chat_id = message.chat_id
@@ -35,8 +68,10 @@ async def start_cmd(c: Client, message: types.Message):
     mention = await message.mention()
 
     if chat_id < 0:  # Group
-        # Track activity for group chats
-        await db.update_chat_activity(chat_id)
+        # Track activity for group chats; the DB write need not delay the reply
+        task = c.loop.create_task(db.update_chat_activity(chat_id))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_done)
         chat_cache.update_activity(chat_id)
         
         welcome_text = (
@@ -58,7 +93,7 @@ async def start_cmd(c: Client, message: types.Message):
         bot_username = c.me.usernames.editable_username
         reply = await message.reply_photo(
             photo=config.START_IMG,
-            caption=startText.format(mention, bot_name),
+            caption=_start_caption(mention, bot_name),
             reply_markup=add_me_markup(bot_username),
         )
 
@@ -81,11 +116,20 @@ async def callback_query_help(c: Client, message: types.UpdateNewCallbackQuery)
         c.logger.warning("Invalid sender type for callback query")
         return None
 
+    if data == "help_back":
+        await message.answer("HOME ..")
+        user = await c.getUser(user_id)
+        await message.edit_message_caption(
+            caption=_start_caption(user.first_name, c.me.first_name),
+            reply_markup=add_me_markup(c.me.usernames.editable_username),
+        )
+        return
+
+    chat_id = message.chat_id
+    user_lang = await language_manager.get_language(user_id, chat_id)
+
     if data == "help_all":
         user = await c.getUser(user_id)
-        chat_id = message.chat_id
-        user_lang = await language_manager.get_language(user_id, chat_id)
-        
         await message.answer(language_manager.get_text("help_button", user_lang))
         welcome_text = language_manager.get_text(
             "start_welcome", 
@@ -103,50 +147,23 @@ async def callback_query_help(c: Client, message: types.UpdateNewCallbackQuery)
                 c.logger.error(f"Failed to edit message: {edit}")
         return
 
-    if data == "help_back":
-        await message.answer("HOME ..")
-        user = await c.getUser(user_id)
-        await message.edit_message_caption(
-            caption=startText.format(user.first_name, c.me.first_name),
-            reply_markup=add_me_markup(c.me.usernames.editable_username),
-        )
-        return
-
-    # Get user language for help categories
-    chat_id = message.chat_id
-    user_lang = await language_manager.get_language(user_id, chat_id)
-    
-    help_categories = {
-        "help_user": {
-            "title": language_manager.get_text("help_user_title", user_lang),
-            "content": language_manager.get_text("help_user_content", user_lang),
-            "markup": BackHelpMenu,
-        },
-        "help_admin": {
-            "title": language_manager.get_text("help_admin_title", user_lang),
-            "content": language_manager.get_text("help_admin_content", user_lang),
-            "markup": BackHelpMenu,
-        },
-        "help_owner": {
-            "title": language_manager.get_text("help_owner_title", user_lang),
-            "content": language_manager.get_text("help_owner_content", user_lang),
-            "markup": BackHelpMenu,
-        },
-        "help_devs": {
-            "title": language_manager.get_text("help_devs_title", user_lang),
-            "content": language_manager.get_text("help_devs_content", user_lang),
-            "markup": BackHelpMenu,
-        },
-    }
-
-    if category := help_categories.get(data):
-        await message.answer(f"📖 {category['title']}")
-        formatted_text = (
-            f"<b>{category['title']}</b>\n\n"
-            f"{category['content']}\n\n"
-            "🔙 <i>Use the buttons below to go back.</i>"
-        )
-        edit = await message.edit_message_caption(formatted_text, reply_markup=category["markup"])
+    cache_key = (user_lang, data)
+    if (caption := _HELP_CAPTIONS.get(cache_key)) is None:
+        if keys := _HELP_CATEGORY_KEYS.get(data):
+            title_key, content_key = keys
+            title = language_manager.get_text(title_key, user_lang)
+            caption = _HELP_CAPTIONS[cache_key] = (
+                title,
+                f"<b>{title}</b>\n\n"
+                f"{language_manager.get_text(content_key, user_lang)}\n\n"
+                "🔙 <i>Use the buttons below to go back.</i>",
+                BackHelpMenu,
+            )
+
+    if caption:
+        title, formatted_text, markup = caption
+        await message.answer(f"📖 {title}")
+        edit = await message.edit_message_caption(formatted_text, reply_markup=markup)
         if isinstance(edit, types.Error):
             if edit.message == "MESSAGE_NOT_MODIFIED":
                 # This is not a real error - the message content is the same
@@ -14,17 +14,16 @@ from .utils.play_helpers import reply_auto_delete_message
 async def stop_song(c: Client, msg: types.Message) -> None:
     """Stop the current playback and clear the queue."""
     chat_id = await is_admin_or_reply(msg)
-    if isinstance(chat_id, types.Error):
-        user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
-        c.logger.warning(language_manager.get_text("stop_admin_check_error", user_lang, error=chat_id.message))
+    if isinstance(chat_id, types.Message):
         return None
 
-    if isinstance(chat_id, types.Message):
+    user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
+    if isinstance(chat_id, types.Error):
+        c.logger.warning(language_manager.get_text("stop_admin_check_error", user_lang, error=chat_id.message))
         return None
 
     _end = await call.end(chat_id)
     if isinstance(_end, types.Error):
-        user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
         await reply_auto_delete_message(
             c, msg, 
             language_manager.get_text("stop_error", user_lang, error=_end.message),
@@ -32,7 +31,6 @@ async def stop_song(c: Client, msg: types.Message) -> None:
         )
         return None
 
-    user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
     await reply_auto_delete_message(
         c, msg,
         language_manager.get_text("stop_success", user_lang, user=await msg.mention()),
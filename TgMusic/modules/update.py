@@ -8,6 +8,8 @@ import os
 import shutil
 import sys
 import uuid
+from collections import deque
+from functools import lru_cache
 from os import execvp
 
 from pytdbot import Client, types
@@ -17,8 +19,13 @@ from TgMusic.logger import LOGGER
 from TgMusic.modules.utils.play_helpers import del_msg
 
 
+# Lines of git pull output kept for the reply
+_GIT_OUTPUT_TAIL = 200
+
+
+@lru_cache(maxsize=1)
 def is_docker():
-    """Check if running inside a Docker container."""
+    """Check if running inside a Docker container (detected once per process)."""
     if os.path.exists("/.dockerenv"):
         return True
     if os.path.isfile("/proc/1/cgroup"):
@@ -31,6 +38,21 @@ def is_docker():
     return False
 
 
+_MAINTENANCE_TEXT = (
+    "🔧 <b>Bot Maintenance</b>\n\n"
+    "The bot is being updated/restarted to bring you new features and improvements.\n"
+    "Your music playback has been stopped temporarily. Please start again after a minute.\n\n"
+    "Thank you for your patience!"
+)
+
+
+def _write_update_log(filename: str, output: str) -> None:
+    """Write the git pull output to disk; runs in a worker thread."""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(output)
+
+
 @Client.on_message(filters=Filter.command(["update", "restart"]))
 async def update(c: Client, message: types.Message) -> None:
     """Handle /update and /restart commands."""
@@ -38,14 +60,16 @@ async def update(c: Client, message: types.Message) -> None:
         await del_msg(message)
         return
 
-    command = message.text.strip().split()[0].lstrip("/")
+    user_lang = await language_manager.get_language(message.from_id, message.chat_id)
+    # Command token after the one-character prefix, without any @mention
+    command = message.text.split(None, 1)[0][1:].partition("@")[0]
+    is_update = command.lower() == "update"
     msg = await message.reply_text(
-        f"{'Updating and ' if command == 'update' else ''}Restarting the bot..."
+        f"{'Updating and ' if is_update else ''}Restarting the bot..."
     )
 
-    if command == "update":
+    if is_update:
         if not os.path.exists(".git"):
-            user_lang = await language_manager.get_language(message.from_id, message.chat_id)
             await msg.edit_text(
                 language_manager.get_text("update_no_git", user_lang)
             )
@@ -53,7 +77,6 @@ async def update(c: Client, message: types.Message) -> None:
 
         git_path = shutil.which("git") or "/usr/bin/git"
         if not os.path.isfile(git_path):
-            user_lang = await language_manager.get_language(message.from_id, message.chat_id)
             await msg.edit_text(language_manager.get_text("update_git_not_found", user_lang))
             return
 
@@ -64,30 +87,33 @@ async def update(c: Client, message: types.Message) -> None:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
             )
-            stdout, _ = await proc.communicate()
-            output = stdout.decode().strip()
+            # Keep only the tail so a huge pull log never sits in memory whole
+            tail = deque(maxlen=_GIT_OUTPUT_TAIL)
+            line_count = 0
+            async for line in proc.stdout:
+                tail.append(line)
+                line_count += 1
+            await proc.wait()
+            output = b"".join(tail).decode(errors="replace").strip()
+            if line_count > len(tail):
+                output = f"... ({line_count - len(tail)} earlier lines omitted)\n{output}"
 
             if proc.returncode != 0:
                 if "Permission denied" in output or "Authentication failed" in output:
-                    user_lang = await language_manager.get_language(message.from_id, message.chat_id)
                     await msg.edit_text(
                         language_manager.get_text("update_private_repo", user_lang)
                     )
                 else:
-                    user_lang = await language_manager.get_language(message.from_id, message.chat_id)
                     await msg.edit_text(f"{language_manager.get_text('update_git_pull_failed', user_lang)}\n<pre>{output}</pre>")
                 return
 
             if "Already up to date." in output:
-                user_lang = await language_manager.get_language(message.from_id, message.chat_id)
                 await msg.edit_text(language_manager.get_text("update_already_updated", user_lang))
                 return
 
             if len(output) > 4096:
                 filename = f"database/{uuid.uuid4().hex}.txt"
-                os.makedirs(os.path.dirname(filename), exist_ok=True)
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(output)
+                await asyncio.to_thread(_write_update_log, filename, output)
 
                 await msg.reply_document(
                     document=types.InputFileLocal(filename),
@@ -95,31 +121,31 @@ async def update(c: Client, message: types.Message) -> None:
                     parse_mode="html",
                     disable_notification=True,
                 )
-                os.remove(filename)
+                await asyncio.to_thread(os.remove, filename)
             else:
-                user_lang = await language_manager.get_language(message.from_id, message.chat_id)
                 await msg.edit_text(
                     f"{language_manager.get_text('update_success', user_lang)}\n<b>Update Output:</b>\n<pre>{output}</pre>"
                 )
 
         except Exception as e:
             LOGGER.error("Unexpected update error: %s", e)
-            user_lang = await language_manager.get_language(message.from_id, message.chat_id)
             await msg.edit_text(f"{language_manager.get_text('update_error', user_lang)} {e}")
             return
 
-    if active_vc := chat_cache.get_active_chats():
-        for chat_id in active_vc:
-            await call.end(chat_id)
-            await c.sendTextMessage(
-                chat_id,
-                "🔧 <b>Bot Maintenance</b>\n\n"
-                "The bot is being updated/restarted to bring you new features and improvements.\n"
-                "Your music playback has been stopped temporarily. Please start again after a minute.\n\n"
-                "Thank you for your patience!",
-                parse_mode="html",
-            )
-            await asyncio.sleep(0.5)
+    if active_vc := chat_cache.iter_active_chats():
+        # Each slot is held for ~1s, keeping us under Telegram's ~30 msg/s limit
+        sem = asyncio.Semaphore(25)
+
+        async def _shutdown(chat_id: int) -> None:
+            async with sem:
+                await call.end(chat_id)
+                await c.sendTextMessage(chat_id, _MAINTENANCE_TEXT, parse_mode="html")
+                await asyncio.sleep(1)
+
+        results = await asyncio.gather(*(_shutdown(chat_id) for chat_id in active_vc), return_exceptions=True)
+        for chat_id, result in zip(active_vc, results):
+            if isinstance(result, Exception):
+                LOGGER.warning("Failed to notify chat %s before restart: %s", chat_id, result)
 
     await msg.edit_text("♻️ Restarting the bot...")
 
@@ -131,7 +157,6 @@ async def update(c: Client, message: types.Message) -> None:
     else:
         tgmusic_path = shutil.which("tgmusic")
         if not tgmusic_path:
-            user_lang = await language_manager.get_language(message.from_id, message.chat_id)
             await msg.edit_text(language_manager.get_text("update_path_error", user_lang))
             return
         execvp("tgmusic", ["tgmusic"])
@@ -8,38 +8,65 @@ __all__ = [
 ]
 
 import asyncio
-import json
+from functools import lru_cache
 
 from ...logger import LOGGER
 
 
+@lru_cache(maxsize=4096)
+def _format_min_sec(seconds: int) -> str:
+    minutes, remaining_seconds = divmod(seconds, 60)
+    return f"{minutes}:{remaining_seconds:02}"
+
+
 def sec_to_min(seconds):
     """
     Convert seconds to minutes:second format.
     """
+    # Durations come from untrusted metadata: NaN/inf or non-numbers log and return None
     try:
-        minutes = int(seconds // 60)
-        remaining_seconds = int(seconds % 60)
-        return f"{minutes}:{remaining_seconds:02}"
+        if not isinstance(seconds, (int, float)):
+            raise TypeError(f"expected a number, got {type(seconds).__name__}")
+        return _format_min_sec(int(seconds))
     except Exception as e:
         LOGGER.warning("Failed to convert seconds to minutes:seconds format: %s", e)
         return None
 
 
 import asyncio
-import json
 import logging
+import os
+
+from cachetools import LRUCache
 
 LOGGER = logging.getLogger(__name__)
 
+# Probed durations keyed by (path, mtime_ns) so a rewritten file is re-probed
+_duration_cache = LRUCache(maxsize=1024)
+
+
 async def get_audio_duration(file_path):
+    try:
+        key = (file_path, os.stat(file_path).st_mtime_ns)
+    except OSError:
+        return await _probe_duration(file_path)
+
+    if (duration := _duration_cache.get(key)) is not None:
+        return duration
+
+    duration = await _probe_duration(file_path)
+    if duration > 0:
+        _duration_cache[key] = duration
+    return duration
+
+
+async def _probe_duration(file_path):
     try:
         proc = await asyncio.create_subprocess_exec(
             "ffprobe",
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_format",
-            "-show_streams",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=nw=1:nk=1",
             file_path,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
@@ -53,12 +80,10 @@ async def get_audio_duration(file_path):
             LOGGER.warning("ffprobe returned no output for %s", file_path)
             return 0
 
-        data = json.loads(stdout)
-
-        if "format" in data and "duration" in data["format"]:
-            duration = float(data["format"]["duration"])
-            return int(duration)
-        else:
+        raw = stdout.decode().strip()
+        try:
+            return int(float(raw))
+        except ValueError:  # "N/A" when the container has no duration
             LOGGER.warning("No 'format.duration' found in ffprobe output for %s", file_path)
             #return a default value of 03:45
             return 225
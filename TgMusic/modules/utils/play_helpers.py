@@ -3,7 +3,10 @@
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 
 import asyncio
-from typing import Any, Union, TYPE_CHECKING
+import heapq
+import itertools
+import re
+from typing import Any, Optional, Union, TYPE_CHECKING
 
 from pytdbot import types
 
@@ -12,6 +15,10 @@ from TgMusic.logger import LOGGER
 if TYPE_CHECKING:
     from pytdbot import Client
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_RETRY_AFTER_RE = re.compile(r"retry after (\d+)")
+_EDIT_MAX_RETRIES = 3
+
 
 async def get_url(
     msg: types.Message, reply: Union[types.Message, None]
@@ -33,32 +40,48 @@ async def get_url(
         text_content = msg.text or ""
         entities = msg.entities or []
 
-    for entity in entities:
-        if entity.type and entity.type["@type"] == "textEntityTypeUrl":
-            offset = entity.offset
-            length = entity.length
-            return text_content[offset : offset + length]
-    return None
+    entity = next(
+        (e for e in entities if e.type and e.type["@type"] == "textEntityTypeUrl"),
+        None,
+    )
+    if entity is None:
+        return None
+
+    offset = entity.offset
+    return text_content[offset : offset + entity.length]
 
 
-def extract_argument(text: str, enforce_digit: bool = False) -> Union[str, None]:
+def extract_argument(text: str, enforce_digit: bool = False) -> Union[int, str, None]:
     """
     Extracts the argument from the command text.
 
     Args:
         text (str): The full command text.
-        enforce_digit (bool): Whether to enforce that the argument is a digit.
+        enforce_digit (bool): Whether to parse the argument as an integer.
 
     Returns:
-        str | None: The extracted argument or None if invalid.
+        int | str | None: The extracted argument (an int when enforce_digit is
+        set) or None if missing or invalid.
     """
-    args = text.strip().split(maxsplit=1)
+    text = text.lstrip()
+    sep = _WHITESPACE_RE.search(text)
+    if sep is None:
+        return None
 
-    if len(args) < 2:
+    # \s+ already skipped leading whitespace; only rstrip when something trails
+    argument = text[sep.end():]
+    if argument[-1:].isspace():
+        argument = argument.rstrip()
+    if not argument:
         return None
 
-    argument = args[1].strip()
-    return None if enforce_digit and not argument.isdigit() else argument
+    if not enforce_digit:
+        return argument
+
+    try:
+        return int(argument)
+    except ValueError:
+        return None
 
 
 async def del_msg(msg: types.Message) -> None:
@@ -102,21 +125,22 @@ async def edit_text(
         LOGGER.warning("Error getting message: %s", reply_message)
         return reply_message
 
-    reply = await reply_message.edit_text(*args, **kwargs)
-    if isinstance(reply, types.Error):
-        if reply.code == 429:
-            retry_after = (
-                int(reply.message.split("retry after ")[1])
-                if "retry after" in reply.message
-                else 2
-            )
-            LOGGER.warning("Rate limited, retrying in %s seconds", retry_after)
-            if retry_after > 20:
-                return reply
-
-            await asyncio.sleep(retry_after)
-            return await edit_text(reply_message, *args, **kwargs)
-        LOGGER.warning("Error editing message: %s", reply)
+    for attempt in range(_EDIT_MAX_RETRIES + 1):
+        reply = await reply_message.edit_text(*args, **kwargs)
+        if not isinstance(reply, types.Error):
+            return reply
+        if reply.code != 429 or attempt == _EDIT_MAX_RETRIES:
+            break
+
+        match = _RETRY_AFTER_RE.search(reply.message)
+        retry_after = int(match.group(1)) if match else 2
+        LOGGER.warning("Rate limited, retrying in %s seconds", retry_after)
+        if retry_after > 20:
+            return reply
+
+        await asyncio.sleep(retry_after)
+
+    LOGGER.warning("Error editing message: %s", reply)
     return reply
 
 
@@ -135,6 +159,56 @@ async def auto_delete_message(msg: types.Message, delay: int = 10) -> None:
         LOGGER.warning("Error in auto_delete_message: %s", e)
 
 
+# Pending auto-deletes as (deadline, seq, message), drained by one reaper task
+_reap_heap: list[tuple[float, int, types.Message]] = []
+_reap_seq = itertools.count()
+_reap_wakeup: Optional[asyncio.Event] = None
+_reaper_task: Optional[asyncio.Task] = None
+
+
+async def _reaper() -> None:
+    """Delete queued messages as their deadlines pass; exits once the heap is empty."""
+    loop = asyncio.get_running_loop()
+    while _reap_heap:
+        timeout = _reap_heap[0][0] - loop.time()
+        if timeout > 0:
+            _reap_wakeup.clear()
+            try:
+                await asyncio.wait_for(_reap_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        now = loop.time()
+        due = []
+        while _reap_heap and _reap_heap[0][0] <= now:
+            due.append(heapq.heappop(_reap_heap)[2])
+
+        results = await asyncio.gather(*(del_msg(msg) for msg in due), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                LOGGER.warning("Error in auto_delete_message: %s", result)
+
+
+def schedule_auto_delete(msg: types.Message, delay: int = 10) -> None:
+    """
+    Queues a message for deletion after a delay without spawning a task per message.
+
+    Args:
+        msg (types.Message): The message to delete.
+        delay (int): Delay in seconds before deletion (default: 10).
+    """
+    global _reap_wakeup, _reaper_task
+    loop = asyncio.get_running_loop()
+    heapq.heappush(_reap_heap, (loop.time() + delay, next(_reap_seq), msg))
+    if _reaper_task is None or _reaper_task.done():
+        _reap_wakeup = asyncio.Event()
+        _reaper_task = loop.create_task(_reaper())
+    else:
+        # A new entry may be due sooner than the one the reaper waits on
+        _reap_wakeup.set()
+
+
 async def send_auto_delete_message(
     client: "Client", 
     chat_id: int, 
@@ -164,7 +238,7 @@ async def send_auto_delete_message(
         
         if not isinstance(msg, types.Error):
             # Start auto-delete task
-            asyncio.create_task(auto_delete_message(msg, delay))
+            schedule_auto_delete(msg, delay)
         
         return msg
     except Exception as e:
@@ -200,7 +274,7 @@ async def reply_auto_delete_message(
         
         if not isinstance(msg, types.Error):
             # Start auto-delete task
-            asyncio.create_task(auto_delete_message(msg, delay))
+            schedule_auto_delete(msg, delay)
         
         return msg
     except Exception as e:
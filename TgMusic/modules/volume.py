@@ -22,8 +22,8 @@ async def volume(c: Client, msg: types.Message) -> None:
     if isinstance(chat_id, types.Message):
         return None
 
-    args = extract_argument(msg.text, enforce_digit=True)
-    if not args:
+    vol_int = extract_argument(msg.text, enforce_digit=True)
+    if vol_int is None:
         await msg.reply_text(
             "🔊 <b>Volume Control</b>\n\n"
             "Usage: <code>/volume [1-200]</code>\n"
@@ -32,13 +32,6 @@ async def volume(c: Client, msg: types.Message) -> None:
         )
         return None
 
-    try:
-        vol_int = int(args)
-    except ValueError:
-        user_lang = await language_manager.get_language(msg.from_id, msg.chat_id)
-        await msg.reply_text(language_manager.get_text("volume_invalid_number", user_lang))
-        return None
-
     if vol_int == 0:
         await msg.reply_text(f"🔇 Playback muted by {await msg.mention()}")
         return None
@@ -5,39 +5,46 @@ Creates session strings for Telegram userbot development with improved stability
 """
 
 import asyncio
+import functools
 import getpass
-import os
+import importlib.util
+import json
+import random
+import re
 import sys
 import time
-from pyrogram import Client
-from pyrogram.errors import (
-    ApiIdInvalid,
-    PhoneNumberInvalid,
-    PhoneCodeInvalid,
-    PhoneCodeExpired,
-    SessionPasswordNeeded,
-    PasswordHashInvalid,
-    FloodWait,
-    BadRequest
-)
-
-# Colors for terminal output
-class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
-    END = '\033[0m'
+from pathlib import Path
+from typing import Final
 
-def print_logo():
-    """Display application logo/banner"""
-    logo = f"""
-{Colors.CYAN}{Colors.BOLD}
+# Colors for terminal output; empty when stdout is not a terminal (pipes, CI logs)
+_COLOR = sys.stdout.isatty()
+
+def _ansi(code):
+    return code if _COLOR else ""
+
+RED: Final[str] = _ansi('\033[91m')
+GREEN: Final[str] = _ansi('\033[92m')
+YELLOW: Final[str] = _ansi('\033[93m')
+BLUE: Final[str] = _ansi('\033[94m')
+MAGENTA: Final[str] = _ansi('\033[95m')
+CYAN: Final[str] = _ansi('\033[96m')
+WHITE: Final[str] = _ansi('\033[97m')
+BOLD: Final[str] = _ansi('\033[1m')
+UNDERLINE: Final[str] = _ansi('\033[4m')
+END: Final[str] = _ansi('\033[0m')
+
+_API_ID_RE = re.compile(r"[1-9]\d{0,9}")
+_PHONE_STRIP = str.maketrans("", "", " -().\u00a0\t")
+
+_OUT = sys.stdout.write
+
+def say(color, msg):
+    """Write one colored line with a single stdout write"""
+    _OUT(f"{color}{msg}{END}\n")
+
+# Static console text, rendered once at import
+_LOGO = f"""
+{CYAN}{BOLD}
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║          🔑 ENHANCED PYROGRAM SESSION GENERATOR 🔑          ║
@@ -45,147 +52,314 @@ def print_logo():
 ║            For Stable Telegram Userbot Development          ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
-{Colors.END}
-    """
-    print(logo)
+{END}
+    \n"""
+
+_API_HELP = "".join([
+    f"{YELLOW}📋 To get API ID and API Hash:{END}\n",
+    f"{WHITE}1. Visit https://my.telegram.org{END}\n",
+    f"{WHITE}2. Login with your phone number{END}\n",
+    f"{WHITE}3. Go to 'API Development Tools'{END}\n",
+    f"{WHITE}4. Create a new application and get API ID & Hash{END}\n",
+    f"{WHITE}5. Never share these credentials with anyone!{END}\n\n",
+])
+
+_TIPS = "".join([
+    f"\n{CYAN}💡 TIPS FOR BETTER SESSION STABILITY:{END}\n",
+    f"{WHITE}• Use consistent device information across sessions{END}\n",
+    f"{WHITE}• Don't create too many sessions in short time periods{END}\n",
+    f"{WHITE}• Keep the same app version for multiple sessions{END}\n",
+    f"{WHITE}• Avoid using sessions from different locations simultaneously{END}\n",
+    f"{WHITE}• Enable 2FA for better account security{END}\n",
+    f"{WHITE}• Regularly check for unauthorized sessions in Telegram settings{END}\n",
+])
+
+_SECURITY_WARNINGS = "".join([
+    f"\n{YELLOW}⚠️  IMPORTANT SECURITY WARNINGS:{END}\n",
+    f"{RED}• NEVER share this session string with anyone!{END}\n",
+    f"{RED}• Store it securely and don't upload to public repositories{END}\n",
+    f"{RED}• This session string provides full access to your Telegram account{END}\n",
+    f"{RED}• If compromised, immediately revoke it by logging out from all devices{END}\n",
+])
+
+def print_logo():
+    """Display application logo/banner"""
+    sys.stdout.write(_LOGO)
+
+class RetryPrompt(Exception):
+    """Raised by a prompt step to have the user asked again"""
+
+def retry(n=3, default=None):
+    """Re-run a prompt step up to n times while it raises RetryPrompt"""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(n):
+                try:
+                    return fn(*args, **kwargs)
+                except RetryPrompt as e:
+                    say(RED, f"❌ {e}")
+                    if attempt < n - 1:
+                        say(YELLOW, f"🔄 Please try again ({attempt + 1}/{n})")
+            say(RED, "❌ Maximum attempts reached. Please try again later.")
+            return default
+        return wrapper
+    return deco
+
+# Prompt defaults from the last successful run, kept in the OS keyring when available
+_KEYRING_SERVICE = "v2music-session"
+
+def _load_profile():
+    """Return the saved prompt defaults, or an empty dict"""
+    try:
+        import keyring
+        raw = keyring.get_password(_KEYRING_SERVICE, "default")
+        return json.loads(raw) if raw else {}
+    except Exception:
+        return {}
+
+def _save_profile(profile):
+    """Remember prompt defaults for the next run; silently skipped without keyring"""
+    try:
+        import keyring
+        keyring.set_password(_KEYRING_SERVICE, "default", json.dumps(profile))
+    except Exception:
+        pass
+
+@retry(3)
+def _prompt_api_id(cached=None):
+    """Ask for the API ID until it is a positive number"""
+    hint = f" [{cached}]" if cached else ""
+    raw_id = (input(f"{GREEN}📱 Enter your API ID{hint}: {END}")).strip() or str(cached or "")
+    if not _API_ID_RE.fullmatch(raw_id):
+        raise RetryPrompt("Error: API ID must be a positive number")
+    return int(raw_id)
 
-def get_api_credentials():
+def get_api_credentials(profile):
     """Get API credentials from user with validation"""
-    print(f"{Colors.YELLOW}📋 To get API ID and API Hash:{Colors.END}")
-    print(f"{Colors.WHITE}1. Visit https://my.telegram.org{Colors.END}")
-    print(f"{Colors.WHITE}2. Login with your phone number{Colors.END}")
-    print(f"{Colors.WHITE}3. Go to 'API Development Tools'{Colors.END}")
-    print(f"{Colors.WHITE}4. Create a new application and get API ID & Hash{Colors.END}")
-    print(f"{Colors.WHITE}5. Never share these credentials with anyone!{Colors.END}\n")
+    if not profile:
+        sys.stdout.write(_API_HELP)
     
-    max_attempts = 3
-    for attempt in range(max_attempts):
-        try:
-            api_id = int(input(f"{Colors.GREEN}📱 Enter your API ID: {Colors.END}"))
-            if api_id <= 0:
-                raise ValueError("API ID must be a positive number")
-            break
-        except ValueError as e:
-            print(f"{Colors.RED}❌ Error: {e}{Colors.END}")
-            if attempt == max_attempts - 1:
-                return None, None
-            print(f"{Colors.YELLOW}🔄 Please try again ({attempt + 1}/{max_attempts}){Colors.END}")
+    api_id = _prompt_api_id(profile.get("api_id"))
+    if api_id is None:
+        return None, None
     
-    api_hash = input(f"{Colors.GREEN}🔐 Enter your API Hash: {Colors.END}").strip()
+    cached_hash = profile.get("api_hash", "")
+    hint = " [saved]" if cached_hash else ""
+    api_hash = (input(f"{GREEN}🔐 Enter your API Hash{hint}: {END}")).strip() or cached_hash
     if not api_hash or len(api_hash) < 32:
-        print(f"{Colors.RED}❌ Error: API Hash cannot be empty and must be valid{Colors.END}")
+        say(RED, "❌ Error: API Hash cannot be empty and must be valid")
         return None, None
     
     return api_id, api_hash
 
-def get_phone_number():
+@retry(3)
+def get_phone_number(cached=None):
     """Get phone number from user with validation"""
-    max_attempts = 3
-    for attempt in range(max_attempts):
-        phone = input(f"{Colors.GREEN}📞 Enter phone number (international format, e.g., +1234567890): {Colors.END}").strip()
-        
-        # Remove spaces and dashes
-        phone = phone.replace(' ', '').replace('-', '')
-        
-        if not phone.startswith('+'):
-            print(f"{Colors.YELLOW}⚠️  Adding '+' prefix to number...{Colors.END}")
-            phone = '+' + phone
-        
-        # Basic validation
-        if len(phone) < 10 or len(phone) > 16:
-            print(f"{Colors.RED}❌ Invalid phone number length{Colors.END}")
-            if attempt == max_attempts - 1:
-                return None
-            continue
-        
-        return phone
+    hint = f" [{cached}]" if cached else ""
+    phone = (input(f"{GREEN}📞 Enter phone number (international format, e.g., +1234567890){hint}: {END}")).strip() or cached or ""
     
-    return None
+    # Drop separators and other formatting noise
+    phone = phone.translate(_PHONE_STRIP)
+    
+    if not phone.startswith('+'):
+        say(YELLOW, "⚠️  Adding '+' prefix to number...")
+        phone = '+' + phone
+    
+    # Basic validation
+    if len(phone) < 10 or len(phone) > 16:
+        raise RetryPrompt("Invalid phone number length")
+    
+    return phone
 
-def get_device_info():
+def get_device_info(profile):
     """Get device information for better session stability"""
-    print(f"\n{Colors.BLUE}🔧 Device Information (for better session stability):{Colors.END}")
+    say(BLUE, "\n🔧 Device Information (for better session stability):")
     
-    device_model = input(f"{Colors.GREEN}📱 Device model (default: PC): {Colors.END}").strip()
-    if not device_model:
-        device_model = "PC"
+    default = profile.get("device_model", "PC")
+    device_model = (input(f"{GREEN}📱 Device model (default: {default}): {END}")).strip() or default
     
-    system_version = input(f"{Colors.GREEN}💻 System version (default: Windows 10): {Colors.END}").strip()
-    if not system_version:
-        system_version = "Windows 10"
+    default = profile.get("system_version", "Windows 10")
+    system_version = (input(f"{GREEN}💻 System version (default: {default}): {END}")).strip() or default
     
-    app_version = input(f"{Colors.GREEN}📦 App version (default: 4.2.4): {Colors.END}").strip()
-    if not app_version:
-        app_version = "4.2.4"
+    default = profile.get("app_version", "4.2.4")
+    app_version = (input(f"{GREEN}📦 App version (default: {default}): {END}")).strip() or default
     
     return device_model, system_version, app_version
 
-async def handle_2fa(app, max_attempts=3):
+async def handle_2fa(app, attempts=3):
     """Handle Two-Factor Authentication properly"""
-    for attempt in range(max_attempts):
+    from pyrogram.errors import PasswordHashInvalid
+
+    say(YELLOW, "🔐 Your account has Two-Factor Authentication (2FA) enabled")
+    for attempt in range(attempts):
+        # Blocking on purpose: no_updates leaves nothing else to run on the loop meanwhile
+        password = getpass.getpass(f"{GREEN}🔑 Enter your 2FA password: {END}")
         try:
-            print(f"{Colors.YELLOW}🔐 Your account has Two-Factor Authentication (2FA) enabled{Colors.END}")
-            password = getpass.getpass(f"{Colors.GREEN}🔑 Enter your 2FA password: {Colors.END}")
-            
-            await app.check_password(password)
-            print(f"{Colors.GREEN}✅ 2FA authentication successful!{Colors.END}")
-            return True
-            
+            await _with_backoff(lambda: app.check_password(password))
         except PasswordHashInvalid:
-            print(f"{Colors.RED}❌ Invalid 2FA password{Colors.END}")
-            if attempt == max_attempts - 1:
-                print(f"{Colors.RED}❌ Maximum attempts reached. Please try again later.{Colors.END}")
-                return False
-            print(f"{Colors.YELLOW}🔄 Please try again ({attempt + 1}/{max_attempts}){Colors.END}")
+            say(RED, "❌ Invalid 2FA password")
+            if attempt < attempts - 1:
+                say(YELLOW, f"🔄 Please try again ({attempt + 1}/{attempts})")
+            continue
         except Exception as e:
-            print(f"{Colors.RED}❌ 2FA error: {e}{Colors.END}")
+            say(RED, f"❌ 2FA error: {e}")
             return False
+        
+        say(GREEN, "✅ 2FA authentication successful!")
+        return True
     
+    say(RED, "❌ Maximum attempts reached. Please try again later.")
     return False
 
-async def validate_session(session_string, api_id, api_hash):
-    """Validate the generated session string"""
+# Rate state shared by consecutive runs, so repeated attempts back off instead of stampeding
+_TOKEN_STATE = Path.home() / ".v2music_tokens.json"
+_BASE_INTERVAL = 10      # σ: minimum seconds between login attempts
+_BACKOFF_FACTOR = 2      # β: interval growth after each FloodWait
+_MAX_INTERVAL = 3600
+
+def _load_token_state():
+    try:
+        return json.loads(_TOKEN_STATE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def _save_token_state(state):
     try:
-        print(f"{Colors.BLUE}🔍 Validating session string...{Colors.END}")
+        _TOKEN_STATE.write_text(json.dumps(state), encoding="utf-8")
+    except OSError:
+        pass
+
+def _record_flood_wait(seconds):
+    """Remember a FloodWait and widen the spacing for later attempts"""
+    state = _load_token_state()
+    state["blocked_until"] = max(state.get("blocked_until", 0), time.time() + seconds)
+    state["interval"] = min(state.get("interval", _BASE_INTERVAL) * _BACKOFF_FACTOR, _MAX_INTERVAL)
+    _save_token_state(state)
+
+def _record_login_success():
+    """Narrow the spacing again after a clean login"""
+    state = _load_token_state()
+    state["interval"] = max(_BASE_INTERVAL, state.get("interval", _BASE_INTERVAL) / _BACKOFF_FACTOR)
+    _save_token_state(state)
+
+async def _pace_login_attempt(max_wait=300):
+    """Wait out the persisted spacing before a new login; False if that would take too long"""
+    state = _load_token_state()
+    ready_at = max(
+        state.get("blocked_until", 0),
+        state.get("last_attempt", 0) + state.get("interval", _BASE_INTERVAL),
+    )
+    wait = ready_at - time.time()
+    if wait > max_wait:
+        say(YELLOW, f"⏳ A previous run hit Telegram's rate limit. Please wait {wait:.0f} seconds and try again.")
+        return False
+    if wait > 0:
+        say(YELLOW, f"⏳ Pacing login attempts, waiting {wait:.0f} seconds...")
+        await asyncio.sleep(wait)
+    
+    state["last_attempt"] = time.time()
+    _save_token_state(state)
+    return True
+
+async def _sign_in_with_code(app, phone, max_attempts=5):
+    """Sign in with the login code, re-prompting on wrong or expired codes like Client.start() does"""
+    from pyrogram.errors import PhoneCodeExpired, PhoneCodeInvalid
+
+    if not await _pace_login_attempt():
+        return None
+    
+    sent_code = await _with_backoff(lambda: app.send_code(phone))
+    for attempt in range(max_attempts):
+        code = input(f"{GREEN}📨 Enter the verification code: {END}").replace(" ", "")
+        try:
+            return await _with_backoff(lambda: app.sign_in(phone, sent_code.phone_code_hash, code))
+        except PhoneCodeInvalid:
+            say(RED, f"❌ Invalid verification code ({attempt + 1}/{max_attempts})")
+        except PhoneCodeExpired:
+            say(YELLOW, "⌛ Verification code expired, sending a new one...")
+            sent_code = await _with_backoff(lambda: app.send_code(phone))
+    
+    say(RED, "❌ Maximum attempts reached. Please try again later.")
+    return None
+
+async def _with_backoff(coro_factory, attempts=8, max_wait=300):
+    """Retry a Telegram call through FloodWait with jittered exponential backoff"""
+    from pyrogram.errors import FloodWait
+
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except FloodWait as e:
+            _record_flood_wait(e.value)
+            # Waits beyond max_wait are surfaced to the user rather than slept through
+            if e.value > max_wait or attempt == attempts - 1:
+                raise
+            delay = e.value + random.uniform(0, min(2 ** attempt, 30))
+            say(YELLOW, f"⏳ Rate limited, retrying in {delay:.0f} seconds ({attempt + 1}/{attempts})")
+            await asyncio.sleep(delay)
+
+async def validate_session(app):
+    """Validate the generated session on the already-connected client"""
+    try:
+        say(BLUE, "🔍 Validating session string...")
         
-        async with Client(
-            name="session_validator",
-            api_id=api_id,
-            api_hash=api_hash,
-            session_string=session_string,
-            in_memory=True
-        ) as app:
-            me = await app.get_me()
-            print(f"{Colors.GREEN}✅ Session validation successful!{Colors.END}")
-            print(f"{Colors.CYAN}👤 Logged in as: {me.first_name} ({me.username or 'No username'}){Colors.END}")
-            return True
+        me = await app.get_me()
+        say(GREEN, "✅ Session validation successful!")
+        say(CYAN, f"👤 Logged in as: {me.first_name} ({me.username or 'No username'})")
+        return True
             
     except Exception as e:
-        print(f"{Colors.RED}❌ Session validation failed: {e}{Colors.END}")
+        say(RED, f"❌ Session validation failed: {e}")
         return False
 
 async def generate_session():
     """Main function to generate session string with enhanced stability"""
+    # Imported here so startup and tips don't pay pyrogram's import cost
+    try:
+        from pyrogram import Client
+        from pyrogram.types import User
+        from pyrogram.errors import (
+            ApiIdInvalid,
+            PhoneNumberInvalid,
+            PhoneCodeInvalid,
+            PhoneCodeExpired,
+            SessionPasswordNeeded,
+            FloodWait,
+            BadRequest
+        )
+    except ImportError:
+        say(RED, "❌ Pyrogram is not installed!")
+        say(YELLOW, "📦 Install with: pip install pyrogram")
+        say(YELLOW, "📦 Or for development: pip install pyrogram[dev]")
+        return
+
+    # Pyrogram falls back to pure-Python AES-IGE without one of these C extensions
+    if not any(importlib.util.find_spec(mod) for mod in ("tgcrypto", "cryptg")):
+        say(YELLOW, "⚠️  TgCrypto not found; login crypto will be slow. Install with: pip install pytgcrypto")
+
     session_string = None
     
     try:
         print_logo()
         
+        profile = await asyncio.to_thread(_load_profile)
+        
         # Get API credentials
-        api_id, api_hash = get_api_credentials()
+        api_id, api_hash = get_api_credentials(profile)
         if not api_id or not api_hash:
             return
         
         # Get phone number
-        phone = get_phone_number()
+        phone = get_phone_number(profile.get("phone"))
         if not phone:
-            print(f"{Colors.RED}❌ Failed to get valid phone number{Colors.END}")
+            say(RED, "❌ Failed to get valid phone number")
             return
         
         # Get device information for better stability
-        device_model, system_version, app_version = get_device_info()
+        device_model, system_version, app_version = get_device_info(profile)
         
-        print(f"\n{Colors.BLUE}🔄 Creating Pyrogram client with enhanced settings...{Colors.END}")
+        say(BLUE, "\n🔄 Creating Pyrogram client with enhanced settings...")
         
         # Create Pyrogram client with enhanced settings for stability
         client_config = {
@@ -198,30 +372,61 @@ async def generate_session():
             "app_version": app_version,
             "lang_code": "en",
             "in_memory": True,
+            "no_updates": True,  # Wrap RPCs in InvokeWithoutUpdates; a one-shot login needs none pushed
             "sleep_threshold": 60,  # Handle flood waits automatically
         }
         
-        async with Client(**client_config) as app:
-            print(f"{Colors.GREEN}✅ Successfully connected to Telegram!{Colors.END}")
+        # One client serves login, 2FA recovery, export and validation
+        app = Client(**client_config)
+        await app.connect()
+        try:
+            try:
+                signed_in = await _sign_in_with_code(app, phone)
+            except SessionPasswordNeeded:
+                # Recover with the password on the same connection instead of re-dialing
+                if not await handle_2fa(app):
+                    return
+            else:
+                if signed_in is None:
+                    return
+                # False or TermsOfService means the number has no Telegram account yet
+                if not isinstance(signed_in, User):
+                    say(RED, "❌ This phone number is not registered on Telegram. Sign up in an official Telegram app first.")
+                    return
+            
+            say(GREEN, "✅ Successfully connected to Telegram!")
+            _record_login_success()
             
             # Generate session string
             session_string = await app.export_session_string()
             
             # Validate the session
-            if await validate_session(session_string, api_id, api_hash):
+            if await validate_session(app):
+                await asyncio.to_thread(_save_profile, {
+                    "api_id": api_id,
+                    "api_hash": api_hash,
+                    "phone": phone,
+                    "device_model": device_model,
+                    "system_version": system_version,
+                    "app_version": app_version,
+                })
+                
                 # Display results
-                print(f"\n{Colors.CYAN}{'='*60}{Colors.END}")
-                print(f"{Colors.GREEN}{Colors.BOLD}🎉 SESSION STRING SUCCESSFULLY CREATED! 🎉{Colors.END}")
-                print(f"{Colors.CYAN}{'='*60}{Colors.END}")
-                print(f"\n{Colors.YELLOW}{Colors.BOLD}📋 Your Session String:{Colors.END}")
-                print(f"{Colors.WHITE}{Colors.BOLD}{session_string}{Colors.END}")
-                print(f"\n{Colors.CYAN}{'='*60}{Colors.END}")
+                rule = "=" * 60
+                _OUT(
+                    f"{CYAN}\n{rule}{END}\n"
+                    f"{GREEN}{BOLD}🎉 SESSION STRING SUCCESSFULLY CREATED! 🎉{END}\n"
+                    f"{CYAN}{rule}{END}\n"
+                    f"{YELLOW}{BOLD}\n📋 Your Session String:{END}\n"
+                    f"{WHITE}{BOLD}{session_string}{END}\n"
+                    f"{CYAN}\n{rule}{END}\n"
+                )
                 
                 # Save to file option
-                save_choice = input(f"\n{Colors.BLUE}💾 Save session string to file? (y/n): {Colors.END}").lower().strip()
+                save_choice = (input(f"\n{BLUE}💾 Save session string to file? (y/n): {END}")).lower().strip()
                 
                 if save_choice in ['y', 'yes']:
-                    filename = input(f"{Colors.GREEN}📄 Filename (default: session_string.txt): {Colors.END}").strip()
+                    filename = (input(f"{GREEN}📄 Filename (default: session_string.txt): {END}")).strip()
                     if not filename:
                         filename = "session_string.txt"
                     
@@ -229,126 +434,72 @@ async def generate_session():
                         filename += '.txt'
                     
                     try:
-                        with open(filename, 'w', encoding='utf-8') as f:
-                            f.write(f"# Telegram Session String\n")
-                            f.write(f"# Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                            f.write(f"# Device: {device_model}\n")
-                            f.write(f"# System: {system_version}\n")
-                            f.write(f"# App Version: {app_version}\n\n")
-                            f.write(session_string)
+                        payload = (
+                            "# Telegram Session String\n"
+                            f"# Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                            f"# Device: {device_model}\n"
+                            f"# System: {system_version}\n"
+                            f"# App Version: {app_version}\n\n"
+                            f"{session_string}"
+                        )
+                        await asyncio.to_thread(Path(filename).write_text, payload, encoding="utf-8")
                         
-                        print(f"{Colors.GREEN}✅ Session string successfully saved to {filename}{Colors.END}")
+                        say(GREEN, f"✅ Session string successfully saved to {filename}")
                     except Exception as e:
-                        print(f"{Colors.RED}❌ Failed to save file: {e}{Colors.END}")
+                        say(RED, f"❌ Failed to save file: {e}")
                 
-                print(f"\n{Colors.YELLOW}⚠️  IMPORTANT SECURITY WARNINGS:{Colors.END}")
-                print(f"{Colors.RED}• NEVER share this session string with anyone!{Colors.END}")
-                print(f"{Colors.RED}• Store it securely and don't upload to public repositories{Colors.END}")
-                print(f"{Colors.RED}• This session string provides full access to your Telegram account{Colors.END}")
-                print(f"{Colors.RED}• If compromised, immediately revoke it by logging out from all devices{Colors.END}")
+                sys.stdout.write(_SECURITY_WARNINGS)
             else:
-                print(f"{Colors.RED}❌ Session validation failed. Please try again.{Colors.END}")
+                say(RED, "❌ Session validation failed. Please try again.")
+        finally:
+            await app.disconnect()
             
     except ApiIdInvalid:
-        print(f"{Colors.RED}❌ Error: Invalid API ID{Colors.END}")
+        say(RED, "❌ Error: Invalid API ID")
     except PhoneNumberInvalid:
-        print(f"{Colors.RED}❌ Error: Invalid phone number{Colors.END}")
+        say(RED, "❌ Error: Invalid phone number")
     except PhoneCodeInvalid:
-        print(f"{Colors.RED}❌ Error: Invalid verification code{Colors.END}")
+        say(RED, "❌ Error: Invalid verification code")
     except PhoneCodeExpired:
-        print(f"{Colors.RED}❌ Error: Verification code has expired{Colors.END}")
-    except SessionPasswordNeeded:
-        print(f"{Colors.YELLOW}🔐 Two-Factor Authentication required{Colors.END}")
-        try:
-            # Recreate client for 2FA handling
-            async with Client(
-                name="session_generator_2fa",
-                api_id=api_id,
-                api_hash=api_hash,
-                phone_number=phone,
-                device_model=device_model,
-                system_version=system_version,
-                app_version=app_version,
-                in_memory=True
-            ) as app:
-                if await handle_2fa(app):
-                    session_string = await app.export_session_string()
-                    
-                    if await validate_session(session_string, api_id, api_hash):
-                        print(f"\n{Colors.GREEN}✅ Session created successfully with 2FA!{Colors.END}")
-                        print(f"{Colors.YELLOW}📋 Your Session String:{Colors.END}")
-                        print(f"{Colors.WHITE}{session_string}{Colors.END}")
-                
-        except Exception as e:
-            print(f"{Colors.RED}❌ Error during 2FA handling: {e}{Colors.END}")
+        say(RED, "❌ Error: Verification code has expired")
     except FloodWait as e:
-        print(f"{Colors.YELLOW}⏳ Rate limited. Please wait {e.value} seconds and try again.{Colors.END}")
+        say(YELLOW, f"⏳ Rate limited. Please wait {e.value} seconds and try again.")
     except BadRequest as e:
-        print(f"{Colors.RED}❌ Bad request: {e}{Colors.END}")
+        say(RED, f"❌ Bad request: {e}")
     except Exception as e:
-        print(f"{Colors.RED}❌ Unexpected error: {e}{Colors.END}")
+        say(RED, f"❌ Unexpected error: {e}")
     finally:
-        # Cleanup temporary session files
-        for session_file in ["session_generator.session", "session_generator_2fa.session", "session_validator.session"]:
-            if os.path.exists(session_file):
-                try:
-                    os.remove(session_file)
-                except:
-                    pass
-
-def check_requirements():
-    """Check if Pyrogram is installed"""
-    try:
-        import pyrogram
-        print(f"{Colors.GREEN}✅ Pyrogram is installed (version: {pyrogram.__version__}){Colors.END}")
-        return True
-    except ImportError:
-        print(f"{Colors.RED}❌ Pyrogram is not installed!{Colors.END}")
-        print(f"{Colors.YELLOW}📦 Install with: pip install pyrogram{Colors.END}")
-        print(f"{Colors.YELLOW}📦 Or for development: pip install pyrogram[dev]{Colors.END}")
-        return False
-    except AttributeError:
-        print(f"{Colors.GREEN}✅ Pyrogram is installed{Colors.END}")
-        return True
+        # Cleanup this script's own session files (and any SQLite journal) only
+        for session_file in Path(".").glob("session_generator.session*"):
+            try:
+                session_file.unlink(missing_ok=True)
+            except OSError:
+                pass
 
 def show_tips():
     """Show tips for better session stability"""
-    print(f"\n{Colors.CYAN}💡 TIPS FOR BETTER SESSION STABILITY:{Colors.END}")
-    print(f"{Colors.WHITE}• Use consistent device information across sessions{Colors.END}")
-    print(f"{Colors.WHITE}• Don't create too many sessions in short time periods{Colors.END}")
-    print(f"{Colors.WHITE}• Keep the same app version for multiple sessions{Colors.END}")
-    print(f"{Colors.WHITE}• Avoid using sessions from different locations simultaneously{Colors.END}")
-    print(f"{Colors.WHITE}• Enable 2FA for better account security{Colors.END}")
-    print(f"{Colors.WHITE}• Regularly check for unauthorized sessions in Telegram settings{Colors.END}")
+    sys.stdout.write(_TIPS)
 
 if __name__ == "__main__":
     try:
-        # Check Python version first
-        if sys.version_info < (3, 7):
-            print(f"{Colors.RED}❌ Python 3.7+ is required to run this script{Colors.END}")
-            print(f"{Colors.YELLOW}Current version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}{Colors.END}")
-            sys.exit(1)
-        
-        print(f"{Colors.GREEN}✅ Python version check passed{Colors.END}")
-        
-        # Check requirements
-        if not check_requirements():
-            sys.exit(1)
-        
-        print(f"{Colors.GREEN}✅ All requirements satisfied{Colors.END}")
-        
         # Show stability tips
         show_tips()
         
+        # Prefer uvloop's libuv event loop when it happens to be installed (uvloop >= 0.18)
+        try:
+            from uvloop import run
+        except ImportError:
+            run = asyncio.run
+        
         # Run the session generator
-        print(f"\n{Colors.BLUE}🚀 Starting session generator...{Colors.END}")
-        asyncio.run(generate_session())
+        say(BLUE, "\n🚀 Starting session generator...")
+        run(generate_session())
         
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}⚠️  Script interrupted by user{Colors.END}")
+        say(YELLOW, "\n⚠️  Script interrupted by user")
     except Exception as e:
-        print(f"{Colors.RED}❌ Fatal error: {e}{Colors.END}")
-        print(f"{Colors.YELLOW}💡 If this error persists, please check your internet connection and API credentials{Colors.END}")
+        say(RED, f"❌ Fatal error: {e}")
+        say(YELLOW, "💡 If this error persists, please check your internet connection and API credentials")
     finally:
-        print(f"\n{Colors.CYAN}👋 Thank you for using Enhanced Session Generator!{Colors.END}")
-        print(f"{Colors.CYAN}🔐 Remember to keep your session strings secure!{Colors.END}")
\ No newline at end of file
+        say(CYAN, "\n👋 Thank you for using Enhanced Session Generator!")
+        say(CYAN, "🔐 Remember to keep your session strings secure!")
\ No newline at end of file